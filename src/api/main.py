@@ -67,6 +67,31 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         _VS.shutdown()
     except Exception:
         pass
+    try:
+        from src.ingestion.market_data import twelve_data_client
+        await twelve_data_client.close()
+    except Exception:
+        pass
+    try:
+        from src.ingestion.market_data import crypto_client
+        await crypto_client.close()
+    except Exception:
+        pass
+    try:
+        from src.ingestion.tier1_core import fred_client
+        await fred_client.close()
+    except Exception:
+        pass
+    try:
+        from src.ingestion.tier2_sentiment import reddit_client
+        await reddit_client.close()
+    except Exception:
+        pass
+    try:
+        from src.llm import client as llm_client
+        await llm_client.close()
+    except Exception:
+        pass
     try:
         await db.disconnect()
     except Exception:
@@ -1,5 +1,6 @@
 """Reddit sentiment API endpoints with live/mock toggle."""
 
+import asyncio
 import logging
 from datetime import UTC, datetime
 from typing import Any
@@ -78,14 +79,18 @@ async def _live_posts() -> dict[str, Any]:
     from src.config.constants import REDDIT_SUBREDDITS
 
     client = _get_reddit_client()
-    all_posts = []
-    for sub in REDDIT_SUBREDDITS:
-        posts = await client.fetch_subreddit_posts(sub, limit=25, time_filter="day")
-        all_posts.extend(p.to_dict() for p in posts)
+    results = await asyncio.gather(
+        *(
+            client.fetch_subreddit_posts(sub, limit=25, time_filter="day")
+            for sub in REDDIT_SUBREDDITS
+        )
+    )
+    all_posts = [p for posts in results for p in posts]
     if not all_posts:
         return {}
-    all_posts.sort(key=lambda p: p["score"], reverse=True)
-    return {"posts": all_posts[:50]}
+    # Rank before serializing so only the returned posts are converted
+    all_posts.sort(key=lambda p: p.score, reverse=True)
+    return {"posts": [p.to_dict() for p in all_posts[:50]]}
 
 
 async def _live_trending() -> dict[str, Any]:
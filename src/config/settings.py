@@ -48,6 +48,9 @@ class Settings(BaseSettings):
     cache_ttl_reddit: int = 900  # 15 minutes
     cache_ttl_crypto: int = 300  # 5 minutes
     cache_ttl_equity: int = 900  # 15 minutes
+    cache_ttl_llm: int = 3600  # 1 hour
+    history_cache_dir: str = "~/.cache/marketview"
+    live_cache_path: str = "~/.cache/marketview/live.sqlite3"
 
     # LLM (report enhancement)
     anthropic_api_key: SecretStr | None = None
@@ -60,6 +63,9 @@ class Settings(BaseSettings):
     chromadb_path: str = "./chroma_data"
     embedding_model: str = "text-embedding-3-small"
     local_embedding_model: str = "all-MiniLM-L6-v2"
+    # "onnx-int8" runs a dynamically quantized ONNX export of the local model
+    local_embedding_backend: Literal["torch", "onnx-int8"] = "torch"
+    model_cache_dir: str = "~/.cache/marketview/models"
     gemini_embedding_model: str = "text-embedding-004"
     chunk_size: int = 1000
     chunk_overlap: int = 200
@@ -128,7 +128,16 @@ class DataAggregator:
 
     async def _fetch_commodities(self) -> dict[str, Any]:
         """Fetch commodity data."""
-        return await self.commodity.get_commodity_summary()
+        summary = await self.commodity.get_commodity_summary()
+
+        return {
+            key: (
+                {k: v.to_dict() for k, v in group.items()}
+                if isinstance(group, dict)
+                else group
+            )
+            for key, group in summary.items()
+        }
 
     async def _fetch_crypto(self) -> dict[str, Any]:
         """Fetch cryptocurrency data."""
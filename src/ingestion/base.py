@@ -1,12 +1,13 @@
 """Base classes for data ingestion."""
 
+import asyncio
 import hashlib
-import json
 import logging
 from abc import ABC, abstractmethod
 from datetime import UTC, datetime
 from typing import Any, Generic, TypeVar
 
+import orjson
 import redis.asyncio as redis
 
 from src.config.settings import settings
@@ -17,6 +18,24 @@ logger = logging.getLogger(__name__)
 T = TypeVar("T")
 
 
+# Dataclass records go through _json_default so their to_dict() shape is kept.
+# Non-str keys are allowed as json.dumps did: DataFrame.reset_index() records
+# (e.g. FREDData.data) carry the unnamed series column as int key 0.
+_ORJSON_OPTIONS = (
+    orjson.OPT_PASSTHROUGH_DATACLASS
+    | orjson.OPT_SERIALIZE_NUMPY
+    | orjson.OPT_NON_STR_KEYS
+)
+
+
+def _json_default(value: Any) -> Any:
+    """Encode records exposing ``to_dict()``; fall back to ``str``."""
+    to_dict = getattr(value, "to_dict", None)
+    if callable(to_dict):
+        return to_dict()
+    return str(value)
+
+
 class CacheManager:
     """Redis-based cache manager."""
 
@@ -62,7 +81,7 @@ class CacheManager:
         try:
             data = await self._redis.get(key)
             if data:
-                return json.loads(data)
+                return orjson.loads(data)
         except Exception as e:
             logger.warning(f"Cache get error for {key}: {e}")
         return None
@@ -73,7 +92,8 @@ class CacheManager:
             await self.connect()
 
         try:
-            await self._redis.setex(key, ttl, json.dumps(value, default=str))
+            payload = orjson.dumps(value, default=_json_default, option=_ORJSON_OPTIONS)
+            await self._redis.setex(key, ttl, payload)
             return True
         except Exception as e:
             logger.warning(f"Cache set error for {key}: {e}")
@@ -122,6 +142,7 @@ class DataSource(ABC, Generic[T]):
         self.cache = CacheManager()
         self.rate_limiter = RateLimiter.from_per_minute(self.rate_limit)
         self.logger = logging.getLogger(f"datasource.{self.source_name}")
+        self._inflight: dict[str, asyncio.Task[Any]] = {}
 
     def _cache_key(self, method: str, *args: Any, **kwargs: Any) -> str:
         """Generate cache key for a method call."""
@@ -156,7 +177,25 @@ class DataSource(ABC, Generic[T]):
             self.logger.debug(f"Cache hit: {cache_key}")
             return cached
 
-        # Rate limit and fetch
+        # Collapse concurrent misses for the same key into one upstream fetch
+        task = self._inflight.get(cache_key)
+        if task is None:
+            task = asyncio.create_task(
+                self._fetch_and_store(method, cache_key, fetch_func, ttl)
+            )
+            self._inflight[cache_key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(cache_key, None))
+
+        return await asyncio.shield(task)
+
+    async def _fetch_and_store(
+        self,
+        method: str,
+        cache_key: str,
+        fetch_func: Any,
+        ttl: int,
+    ) -> T | None:
+        """Rate-limit, fetch and cache a single upstream request."""
         await self.rate_limiter.acquire()
 
         try:
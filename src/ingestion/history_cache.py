@@ -0,0 +1,57 @@
+"""On-disk Parquet cache for yfinance historical price frames."""
+
+from __future__ import annotations
+
+import logging
+import re
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import yfinance as yf
+
+from src.config.settings import settings
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+_UNSAFE_CHARS = re.compile(r"[^A-Za-z0-9._-]")
+
+
+def history_cache_path(symbol: str, period: str, interval: str) -> Path:
+    """Return the cache file for a (symbol, period, interval) window."""
+    name = _UNSAFE_CHARS.sub("_", f"{symbol}_{period}_{interval}")
+    return Path(settings.history_cache_dir).expanduser() / f"{name}.parquet"
+
+
+def fetch_history(
+    symbol: str,
+    period: str,
+    interval: str,
+    ttl: int,
+) -> pd.DataFrame:
+    """Load history from disk if fresh, else fetch from Yahoo and persist.
+
+    Blocking — call via ``asyncio.to_thread``.
+    """
+    import pandas as pd
+
+    path = history_cache_path(symbol, period, interval)
+    try:
+        if path.exists() and time.time() - path.stat().st_mtime < ttl:
+            return pd.read_parquet(path)
+    except Exception as e:
+        logger.warning("History cache read failed for %s: %s", path, e)
+
+    history = yf.Ticker(symbol).history(period=period, interval=interval)
+
+    if not history.empty:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            history.to_parquet(path)
+        except Exception as e:
+            logger.warning("History cache write failed for %s: %s", path, e)
+
+    return history
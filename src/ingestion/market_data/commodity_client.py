@@ -1,16 +1,21 @@
 """Commodity market data client."""
 
+from __future__ import annotations
+
 import asyncio
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import UTC, datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import pandas as pd
 import yfinance as yf
 
 from src.config.constants import COMMODITIES
 from src.config.settings import settings
 from src.ingestion.base import DataSource
+from src.ingestion.history_cache import fetch_history
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 @dataclass
@@ -30,19 +35,25 @@ class CommodityData:
     timestamp: datetime = field(default_factory=lambda: datetime.now(UTC))
 
     def to_dict(self) -> dict[str, Any]:
-        return {
-            "symbol": self.symbol,
-            "name": self.name,
-            "price": self.price,
-            "change": self.change,
-            "change_percent": self.change_percent,
-            "day_high": self.day_high,
-            "day_low": self.day_low,
-            "volume": self.volume,
-            "fifty_two_week_high": self.fifty_two_week_high,
-            "fifty_two_week_low": self.fifty_two_week_low,
-            "timestamp": self.timestamp.isoformat(),
-        }
+        data = {name: getattr(self, name) for name in _COMMODITY_FIELDS}
+        data["timestamp"] = self.timestamp.isoformat()
+        return data
+
+
+_COMMODITY_FIELDS = tuple(f.name for f in fields(CommodityData))
+
+# Summary grouping for each configured commodity
+_COMMODITY_CATEGORY = {
+    "gold": "precious_metals",
+    "silver": "precious_metals",
+    "wti_crude": "energy",
+    "brent_crude": "energy",
+    "natural_gas": "energy",
+    "corn": "agriculture",
+    "wheat": "agriculture",
+    "soybeans": "agriculture",
+    "copper": "industrial",
+}
 
 
 class CommodityClient(DataSource[dict[str, CommodityData]]):
@@ -56,7 +67,7 @@ class CommodityClient(DataSource[dict[str, CommodityData]]):
         """Check Yahoo Finance commodity availability."""
         try:
             ticker = yf.Ticker("GC=F")
-            await asyncio.to_thread(lambda: ticker.info)
+            await asyncio.to_thread(getattr, ticker, "info")
             return True
         except Exception as e:
             self.logger.error(f"Commodity health check failed: {e}")
@@ -66,8 +77,17 @@ class CommodityClient(DataSource[dict[str, CommodityData]]):
         """Fetch latest data for all configured commodities."""
         return await self.get_all_commodities()
 
-    async def get_commodity(self, commodity_name: str) -> CommodityData | None:
-        """Get data for a specific commodity."""
+    async def get_commodity(
+        self,
+        commodity_name: str,
+        as_of: datetime | None = None,
+    ) -> CommodityData | None:
+        """Get data for a specific commodity.
+
+        Args:
+            commodity_name: Commodity key from COMMODITIES
+            as_of: Shared batch timestamp (defaults to now)
+        """
         symbol = COMMODITIES.get(commodity_name)
         if not symbol:
             self.logger.error(f"Unknown commodity: {commodity_name}")
@@ -76,7 +96,7 @@ class CommodityClient(DataSource[dict[str, CommodityData]]):
         async def _fetch() -> CommodityData | None:
             try:
                 ticker = yf.Ticker(symbol)
-                info = await asyncio.to_thread(lambda: ticker.info)
+                info = await asyncio.to_thread(getattr, ticker, "info")
 
                 price = info.get("regularMarketPrice", info.get("ask", 0))
                 prev_close = info.get("previousClose", info.get("regularMarketPreviousClose", price))
@@ -95,6 +115,7 @@ class CommodityClient(DataSource[dict[str, CommodityData]]):
                     volume=info.get("regularMarketVolume", info.get("volume", 0)),
                     fifty_two_week_high=info.get("fiftyTwoWeekHigh"),
                     fifty_two_week_low=info.get("fiftyTwoWeekLow"),
+                    timestamp=as_of or datetime.now(UTC),
                 )
             except Exception as e:
                 self.logger.error(f"Error fetching {commodity_name}: {e}")
@@ -104,7 +125,8 @@ class CommodityClient(DataSource[dict[str, CommodityData]]):
 
     async def get_all_commodities(self) -> dict[str, CommodityData]:
         """Get data for all configured commodities."""
-        tasks = [self.get_commodity(name) for name in COMMODITIES.keys()]
+        now = datetime.now(UTC)
+        tasks = [self.get_commodity(name, as_of=now) for name in COMMODITIES.keys()]
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
         data = {}
@@ -168,13 +190,13 @@ class CommodityClient(DataSource[dict[str, CommodityData]]):
 
         async def _fetch() -> pd.DataFrame | None:
             try:
-                ticker = yf.Ticker(symbol)
-                history = await asyncio.to_thread(
-                    ticker.history,
-                    period=period,
-                    interval=interval,
+                return await asyncio.to_thread(
+                    fetch_history,
+                    symbol,
+                    period,
+                    interval,
+                    self.cache_ttl,
                 )
-                return history
             except Exception as e:
                 self.logger.error(f"Error fetching history for {commodity_name}: {e}")
                 return None
@@ -188,19 +210,24 @@ class CommodityClient(DataSource[dict[str, CommodityData]]):
         )
 
     async def get_commodity_summary(self) -> dict[str, Any]:
-        """Get comprehensive commodity summary."""
+        """Get comprehensive commodity summary.
+
+        Category groups hold CommodityData records; callers serialize
+        them with ``to_dict()`` at the JSON boundary.
+        """
         all_commodities = await self.get_all_commodities()
 
-        # Group by category
-        precious = {k: v for k, v in all_commodities.items() if k in ["gold", "silver"]}
-        energy = {k: v for k, v in all_commodities.items() if k in ["wti_crude", "brent_crude", "natural_gas"]}
-        agriculture = {k: v for k, v in all_commodities.items() if k in ["corn", "wheat", "soybeans"]}
-        industrial = {k: v for k, v in all_commodities.items() if k in ["copper"]}
+        # Group by category in a single pass
+        groups: dict[str, dict[str, Any]] = {
+            "precious_metals": {},
+            "energy": {},
+            "agriculture": {},
+            "industrial": {},
+        }
+        for k, v in all_commodities.items():
+            groups[_COMMODITY_CATEGORY[k]][k] = v
 
         return {
-            "precious_metals": {k: v.to_dict() for k, v in precious.items()},
-            "energy": {k: v.to_dict() for k, v in energy.items()},
-            "agriculture": {k: v.to_dict() for k, v in agriculture.items()},
-            "industrial": {k: v.to_dict() for k, v in industrial.items()},
+            **groups,
             "timestamp": datetime.now(UTC).isoformat(),
         }
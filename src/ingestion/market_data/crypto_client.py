@@ -5,7 +5,9 @@ from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any
 
-from pycoingecko import CoinGeckoAPI
+import aiohttp
+import numpy as np
+import pandas as pd
 
 from src.config.constants import CRYPTO_IDS
 from src.config.settings import settings
@@ -84,6 +86,59 @@ class CryptoMarketOverview:
         }
 
 
+COINGECKO_BASE_URL = "https://api.coingecko.com/api/v3"
+
+# Shared pooled session; clients are created per aggregator/engine, the
+# session is not
+_session: aiohttp.ClientSession | None = None
+_session_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _get_session() -> aiohttp.ClientSession:
+    """Return the shared CoinGecko session, creating it on first use.
+
+    Sessions are bound to an event loop, so a new one is made if the
+    caller runs on a different loop (e.g. one per Celery task).
+    """
+    global _session, _session_loop
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        _session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30))
+        _session_loop = loop
+    return _session
+
+
+async def close() -> None:
+    """Close the shared CoinGecko session."""
+    global _session, _session_loop
+    if _session is not None:
+        await _session.close()
+        _session = None
+        _session_loop = None
+
+# CryptoData attribute -> CoinGecko /coins/markets response key
+_COIN_FIELD_MAP = {
+    "id": "id",
+    "symbol": "symbol",
+    "name": "name",
+    "current_price": "current_price",
+    "market_cap": "market_cap",
+    "market_cap_rank": "market_cap_rank",
+    "total_volume": "total_volume",
+    "high_24h": "high_24h",
+    "low_24h": "low_24h",
+    "price_change_24h": "price_change_24h",
+    "price_change_percentage_24h": "price_change_percentage_24h",
+    "price_change_percentage_7d": "price_change_percentage_7d_in_currency",
+    "price_change_percentage_30d": "price_change_percentage_30d_in_currency",
+    "circulating_supply": "circulating_supply",
+    "total_supply": "total_supply",
+    "ath": "ath",
+    "ath_change_percentage": "ath_change_percentage",
+    "atl": "atl",
+}
+
+
 class CryptoClient(DataSource[dict[str, CryptoData]]):
     """CoinGecko API client for cryptocurrency data."""
 
@@ -91,14 +146,18 @@ class CryptoClient(DataSource[dict[str, CryptoData]]):
     cache_ttl = settings.cache_ttl_crypto
     rate_limit = settings.rate_limit_coingecko
 
-    def __init__(self) -> None:
-        super().__init__()
-        self._client = CoinGeckoAPI()
+    async def _get(self, path: str, **params: Any) -> Any:
+        """GET a CoinGecko endpoint and decode the JSON body."""
+        async with _get_session().get(
+            f"{COINGECKO_BASE_URL}{path}", params=params
+        ) as resp:
+            resp.raise_for_status()
+            return await resp.json()
 
     async def health_check(self) -> bool:
         """Check CoinGecko API availability."""
         try:
-            await asyncio.to_thread(self._client.ping)
+            await self._get("/ping")
             return True
         except Exception as e:
             self.logger.error(f"CoinGecko health check failed: {e}")
@@ -117,8 +176,8 @@ class CryptoClient(DataSource[dict[str, CryptoData]]):
 
         async def _fetch() -> dict[str, CryptoData]:
             try:
-                data = await asyncio.to_thread(
-                    self._client.get_coins_markets,
+                data = await self._get(
+                    "/coins/markets",
                     vs_currency=vs_currency,
                     ids=",".join(coin_ids),
                     order="market_cap_desc",
@@ -126,28 +185,12 @@ class CryptoClient(DataSource[dict[str, CryptoData]]):
                     price_change_percentage="24h,7d,30d",
                 )
 
+                now = datetime.now(UTC)
                 result = {}
                 for coin in data:
-                    result[coin["id"]] = CryptoData(
-                        id=coin["id"],
-                        symbol=coin["symbol"].upper(),
-                        name=coin["name"],
-                        current_price=coin["current_price"],
-                        market_cap=coin["market_cap"],
-                        market_cap_rank=coin["market_cap_rank"],
-                        total_volume=coin["total_volume"],
-                        high_24h=coin["high_24h"],
-                        low_24h=coin["low_24h"],
-                        price_change_24h=coin["price_change_24h"],
-                        price_change_percentage_24h=coin["price_change_percentage_24h"],
-                        price_change_percentage_7d=coin.get("price_change_percentage_7d_in_currency"),
-                        price_change_percentage_30d=coin.get("price_change_percentage_30d_in_currency"),
-                        circulating_supply=coin.get("circulating_supply"),
-                        total_supply=coin.get("total_supply"),
-                        ath=coin.get("ath"),
-                        ath_change_percentage=coin.get("ath_change_percentage"),
-                        atl=coin.get("atl"),
-                    )
+                    kwargs = {dst: coin.get(src) for dst, src in _COIN_FIELD_MAP.items()}
+                    kwargs["symbol"] = kwargs["symbol"].upper()
+                    result[coin["id"]] = CryptoData(**kwargs, timestamp=now)
                 return result
             except Exception as e:
                 self.logger.error(f"Error fetching crypto data: {e}")
@@ -165,7 +208,7 @@ class CryptoClient(DataSource[dict[str, CryptoData]]):
 
         async def _fetch() -> CryptoMarketOverview | None:
             try:
-                data = await asyncio.to_thread(self._client.get_global)
+                data = await self._get("/global")
 
                 market_data = data["data"]
                 return CryptoMarketOverview(
@@ -192,19 +235,20 @@ class CryptoClient(DataSource[dict[str, CryptoData]]):
 
         async def _fetch() -> list[tuple[datetime, float]] | None:
             try:
-                data = await asyncio.to_thread(
-                    self._client.get_coin_market_chart_by_id,
-                    id=coin_id,
+                data = await self._get(
+                    f"/coins/{coin_id}/market_chart",
                     vs_currency=vs_currency,
                     days=days,
                 )
 
-                prices = []
-                for timestamp, price in data["prices"]:
-                    dt = datetime.fromtimestamp(timestamp / 1000, tz=UTC)
-                    prices.append((dt, price))
+                raw = data["prices"]
+                if not raw:
+                    return []
 
-                return prices
+                # Convert [ms_timestamp, price] pairs in one vectorized pass
+                arr = np.asarray(raw, dtype=np.float64)
+                times = pd.to_datetime(arr[:, 0], unit="ms", utc=True).to_pydatetime()
+                return list(zip(times, arr[:, 1].tolist()))
             except Exception as e:
                 self.logger.error(f"Error fetching historical prices for {coin_id}: {e}")
                 return None
@@ -1,16 +1,35 @@
 """Equity market data client using yfinance."""
 
+from __future__ import annotations
+
 import asyncio
-from dataclasses import dataclass, field
-from datetime import UTC, datetime, timedelta
-from typing import Any
+from dataclasses import dataclass, field, fields
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
 
-import pandas as pd
 import yfinance as yf
 
 from src.config.constants import INDICES
 from src.config.settings import settings
 from src.ingestion.base import DataSource
+from src.ingestion.history_cache import fetch_history
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+_SECTOR_ETFS: tuple[tuple[str, str], ...] = (
+    ("technology", "XLK"),
+    ("healthcare", "XLV"),
+    ("financials", "XLF"),
+    ("consumer_discretionary", "XLY"),
+    ("consumer_staples", "XLP"),
+    ("industrials", "XLI"),
+    ("energy", "XLE"),
+    ("materials", "XLB"),
+    ("utilities", "XLU"),
+    ("real_estate", "XLRE"),
+    ("communication", "XLC"),
+)
 
 
 @dataclass
@@ -35,24 +54,12 @@ class EquityData:
     timestamp: datetime = field(default_factory=lambda: datetime.now(UTC))
 
     def to_dict(self) -> dict[str, Any]:
-        return {
-            "symbol": self.symbol,
-            "name": self.name,
-            "current_price": self.current_price,
-            "previous_close": self.previous_close,
-            "open_price": self.open_price,
-            "day_high": self.day_high,
-            "day_low": self.day_low,
-            "volume": self.volume,
-            "change": self.change,
-            "change_percent": self.change_percent,
-            "fifty_two_week_high": self.fifty_two_week_high,
-            "fifty_two_week_low": self.fifty_two_week_low,
-            "market_cap": self.market_cap,
-            "pe_ratio": self.pe_ratio,
-            "dividend_yield": self.dividend_yield,
-            "timestamp": self.timestamp.isoformat(),
-        }
+        data = {name: getattr(self, name) for name in _EQUITY_FIELDS}
+        data["timestamp"] = self.timestamp.isoformat()
+        return data
+
+
+_EQUITY_FIELDS = tuple(f.name for f in fields(EquityData))
 
 
 @dataclass
@@ -90,7 +97,7 @@ class EquityClient(DataSource[dict[str, EquityData]]):
         """Check Yahoo Finance availability."""
         try:
             ticker = yf.Ticker("^GSPC")
-            await asyncio.to_thread(lambda: ticker.info)
+            await asyncio.to_thread(getattr, ticker, "info")
             return True
         except Exception as e:
             self.logger.error(f"Yahoo Finance health check failed: {e}")
@@ -100,13 +107,22 @@ class EquityClient(DataSource[dict[str, EquityData]]):
         """Fetch latest data for all configured indices."""
         return await self.get_indices()
 
-    async def get_quote(self, symbol: str) -> EquityData | None:
-        """Get quote for a single symbol."""
+    async def get_quote(
+        self,
+        symbol: str,
+        as_of: datetime | None = None,
+    ) -> EquityData | None:
+        """Get quote for a single symbol.
+
+        Args:
+            symbol: Yahoo Finance ticker symbol
+            as_of: Shared batch timestamp (defaults to now)
+        """
 
         async def _fetch() -> EquityData | None:
             try:
                 ticker = yf.Ticker(symbol)
-                info = await asyncio.to_thread(lambda: ticker.info)
+                info = await asyncio.to_thread(getattr, ticker, "info")
 
                 # Handle missing data gracefully
                 current_price = info.get("regularMarketPrice") or info.get("currentPrice", 0)
@@ -131,6 +147,7 @@ class EquityClient(DataSource[dict[str, EquityData]]):
                     market_cap=info.get("marketCap"),
                     pe_ratio=info.get("trailingPE"),
                     dividend_yield=info.get("dividendYield"),
+                    timestamp=as_of or datetime.now(UTC),
                 )
             except Exception as e:
                 self.logger.error(f"Error fetching {symbol}: {e}")
@@ -138,9 +155,10 @@ class EquityClient(DataSource[dict[str, EquityData]]):
 
         return await self._with_cache("get_quote", _fetch, symbol)
 
-    async def get_indices(self) -> dict[str, EquityData]:
+    async def get_indices(self, as_of: datetime | None = None) -> dict[str, EquityData]:
         """Get data for all major indices."""
-        tasks = [self.get_quote(symbol) for symbol in INDICES.values()]
+        now = as_of or datetime.now(UTC)
+        tasks = [self.get_quote(symbol, as_of=now) for symbol in INDICES.values()]
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
         data = {}
@@ -162,13 +180,13 @@ class EquityClient(DataSource[dict[str, EquityData]]):
 
         async def _fetch() -> pd.DataFrame | None:
             try:
-                ticker = yf.Ticker(symbol)
-                history = await asyncio.to_thread(
-                    ticker.history,
-                    period=period,
-                    interval=interval,
+                return await asyncio.to_thread(
+                    fetch_history,
+                    symbol,
+                    period,
+                    interval,
+                    self.cache_ttl,
                 )
-                return history
             except Exception as e:
                 self.logger.error(f"Error fetching history for {symbol}: {e}")
                 return None
@@ -181,41 +199,33 @@ class EquityClient(DataSource[dict[str, EquityData]]):
             interval=interval,
         )
 
-    async def get_vix(self) -> EquityData | None:
+    async def get_vix(self, as_of: datetime | None = None) -> EquityData | None:
         """Get VIX data."""
-        return await self.get_quote("^VIX")
+        return await self.get_quote("^VIX", as_of=as_of)
 
-    async def get_sector_performance(self) -> dict[str, float]:
+    async def get_sector_performance(self, as_of: datetime | None = None) -> dict[str, float]:
         """Get sector ETF performance."""
-        sector_etfs = {
-            "technology": "XLK",
-            "healthcare": "XLV",
-            "financials": "XLF",
-            "consumer_discretionary": "XLY",
-            "consumer_staples": "XLP",
-            "industrials": "XLI",
-            "energy": "XLE",
-            "materials": "XLB",
-            "utilities": "XLU",
-            "real_estate": "XLRE",
-            "communication": "XLC",
-        }
-
-        tasks = [self.get_quote(symbol) for symbol in sector_etfs.values()]
+        now = as_of or datetime.now(UTC)
+        tasks = [self.get_quote(symbol, as_of=now) for _, symbol in _SECTOR_ETFS]
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
         performance = {}
-        for sector, result in zip(sector_etfs.keys(), results):
+        for (sector, _), result in zip(_SECTOR_ETFS, results):
             if isinstance(result, EquityData):
                 performance[sector] = result.change_percent
 
         return performance
 
     async def get_market_summary(self) -> dict[str, Any]:
-        """Get overall market summary."""
-        indices = await self.get_indices()
-        vix = await self.get_vix()
-        sectors = await self.get_sector_performance()
+        """Get overall market summary.
+
+        Index and VIX entries are EquityData records; callers serialize
+        them with ``to_dict()`` at the JSON boundary.
+        """
+        now = datetime.now(UTC)
+        indices = await self.get_indices(as_of=now)
+        vix = await self.get_vix(as_of=now)
+        sectors = await self.get_sector_performance(as_of=now)
 
         # Calculate market breadth from index changes
         advancing = sum(1 for d in indices.values() if d.change_percent > 0)
@@ -223,8 +233,8 @@ class EquityClient(DataSource[dict[str, EquityData]]):
         unchanged = len(indices) - advancing - declining
 
         return {
-            "indices": {k: v.to_dict() for k, v in indices.items()},
-            "vix": vix.to_dict() if vix else None,
+            "indices": indices,
+            "vix": vix,
             "sectors": sectors,
             "breadth": {
                 "advancing": advancing,
@@ -232,7 +242,7 @@ class EquityClient(DataSource[dict[str, EquityData]]):
                 "unchanged": unchanged,
                 "ratio": advancing / declining if declining > 0 else float("inf"),
             },
-            "timestamp": datetime.now(UTC).isoformat(),
+            "timestamp": now.isoformat(),
         }
 
     async def get_us_indices(self) -> dict[str, EquityData]:
@@ -1,19 +1,29 @@
 """Foreign exchange market data client."""
 
+from __future__ import annotations
+
 import asyncio
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import UTC, datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import pandas as pd
 import yfinance as yf
 
 from src.config.constants import FX_PAIRS
 from src.config.settings import settings
 from src.ingestion.base import DataSource
+from src.ingestion.history_cache import fetch_history
+from src.ingestion.quote_info import fetch_quote_info
+
+if TYPE_CHECKING:
+    import pandas as pd
 
+# For USD/XXX pairs, positive change = USD strength;
+# for XXX/USD pairs, negative change = USD strength
+_USD_SIGN = {name: 1 if name.startswith("usd") else -1 for name in FX_PAIRS}
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class FXData:
     """FX pair market data."""
 
@@ -28,20 +38,15 @@ class FXData:
     timestamp: datetime = field(default_factory=lambda: datetime.now(UTC))
 
     def to_dict(self) -> dict[str, Any]:
-        return {
-            "pair": self.pair,
-            "rate": self.rate,
-            "change": self.change,
-            "change_percent": self.change_percent,
-            "day_high": self.day_high,
-            "day_low": self.day_low,
-            "fifty_two_week_high": self.fifty_two_week_high,
-            "fifty_two_week_low": self.fifty_two_week_low,
-            "timestamp": self.timestamp.isoformat(),
-        }
+        data = {name: getattr(self, name) for name in _FX_FIELDS}
+        data["timestamp"] = self.timestamp.isoformat()
+        return data
+
+
+_FX_FIELDS = tuple(f.name for f in fields(FXData))
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DXYData:
     """Dollar Index data."""
 
@@ -53,14 +58,12 @@ class DXYData:
     timestamp: datetime = field(default_factory=lambda: datetime.now(UTC))
 
     def to_dict(self) -> dict[str, Any]:
-        return {
-            "value": self.value,
-            "change": self.change,
-            "change_percent": self.change_percent,
-            "day_high": self.day_high,
-            "day_low": self.day_low,
-            "timestamp": self.timestamp.isoformat(),
-        }
+        data = {name: getattr(self, name) for name in _DXY_FIELDS}
+        data["timestamp"] = self.timestamp.isoformat()
+        return data
+
+
+_DXY_FIELDS = tuple(f.name for f in fields(DXYData))
 
 
 class FXClient(DataSource[dict[str, FXData]]):
@@ -74,7 +77,7 @@ class FXClient(DataSource[dict[str, FXData]]):
         """Check Yahoo Finance FX availability."""
         try:
             ticker = yf.Ticker("EURUSD=X")
-            await asyncio.to_thread(lambda: ticker.info)
+            await asyncio.to_thread(getattr, ticker, "info")
             return True
         except Exception as e:
             self.logger.error(f"FX health check failed: {e}")
@@ -93,8 +96,7 @@ class FXClient(DataSource[dict[str, FXData]]):
 
         async def _fetch() -> FXData | None:
             try:
-                ticker = yf.Ticker(symbol)
-                info = await asyncio.to_thread(lambda: ticker.info)
+                info = await asyncio.to_thread(fetch_quote_info, symbol)
 
                 rate = info.get("regularMarketPrice", info.get("ask", 0))
                 prev_close = info.get("previousClose", info.get("regularMarketPreviousClose", rate))
@@ -137,8 +139,7 @@ class FXClient(DataSource[dict[str, FXData]]):
 
         async def _fetch() -> DXYData | None:
             try:
-                ticker = yf.Ticker("DX-Y.NYB")
-                info = await asyncio.to_thread(lambda: ticker.info)
+                info = await asyncio.to_thread(fetch_quote_info, "DX-Y.NYB")
 
                 value = info.get("regularMarketPrice", info.get("ask", 0))
                 prev_close = info.get("previousClose", info.get("regularMarketPreviousClose", value))
@@ -172,13 +173,13 @@ class FXClient(DataSource[dict[str, FXData]]):
 
         async def _fetch() -> pd.DataFrame | None:
             try:
-                ticker = yf.Ticker(symbol)
-                history = await asyncio.to_thread(
-                    ticker.history,
-                    period=period,
-                    interval=interval,
+                return await asyncio.to_thread(
+                    fetch_history,
+                    symbol,
+                    period,
+                    interval,
+                    self.cache_ttl,
                 )
-                return history
             except Exception as e:
                 self.logger.error(f"Error fetching history for {pair_name}: {e}")
                 return None
@@ -219,24 +220,30 @@ class FXClient(DataSource[dict[str, FXData]]):
 
     async def get_fx_summary(self) -> dict[str, Any]:
         """Get comprehensive FX market summary."""
-        all_pairs = await self.get_all_pairs()
-        dxy = await self.get_dxy()
-
-        # Categorize by strength
+        all_pairs, dxy = await asyncio.gather(
+            self.get_all_pairs(),
+            self.get_dxy(),
+            return_exceptions=True,
+        )
+        if isinstance(all_pairs, Exception):
+            self.logger.error(f"Error fetching FX pairs: {all_pairs}")
+            all_pairs = {}
+        if isinstance(dxy, Exception):
+            self.logger.error(f"Error fetching DXY: {dxy}")
+            dxy = None
+
+        # Serialize pairs and categorize by strength in one pass
+        pairs = {}
         usd_strength = []
         for name, data in all_pairs.items():
-            # For USD/XXX pairs, positive change = USD strength
-            # For XXX/USD pairs, negative change = USD strength
-            if name.startswith("usd"):
-                usd_strength.append(data.change_percent)
-            else:
-                usd_strength.append(-data.change_percent)
+            pairs[name] = data.to_dict()
+            usd_strength.append(_USD_SIGN[name] * data.change_percent)
 
         avg_usd_strength = sum(usd_strength) / len(usd_strength) if usd_strength else 0
 
         return {
             "dxy": dxy.to_dict() if dxy else None,
-            "pairs": {k: v.to_dict() for k, v in all_pairs.items()},
+            "pairs": pairs,
             "usd_strength_index": avg_usd_strength,
             "timestamp": datetime.now(UTC).isoformat(),
         }
@@ -4,18 +4,29 @@ Twelve Data free tier: 8 credits/min, each symbol = 1 credit.
 We use TD only for crypto (6 credits/call) to stay within limits.
 Everything else (equities, FX, commodities, indices) uses yfinance directly,
 bypassing the broken Redis cache serialization in base.py.
-All results use plain dicts + in-memory TTL cache.
+All results use plain dicts + an in-memory TTL cache backed by a local
+SQLite file shared across worker processes.
 """
 
 import asyncio
 import logging
+import random
+import sqlite3
+import threading
 import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
+from pathlib import Path
 from typing import Any
 
 import httpx
+import orjson
+import yfinance as yf
 
 from src.config.settings import settings
+from src.ingestion.quote_info import fetch_quote_info
 
 logger = logging.getLogger(__name__)
 
@@ -56,6 +67,25 @@ CRYPTO_SYMBOLS = {
     "cardano": "ADA/USD",
 }
 
+# CoinGecko-style asset ids and ticker symbols for the crypto keys
+CRYPTO_IDS = {
+    "bitcoin": "bitcoin",
+    "ethereum": "ethereum",
+    "solana": "solana",
+    "bnb": "binancecoin",
+    "xrp": "ripple",
+    "cardano": "cardano",
+}
+
+CRYPTO_TICKERS = {
+    "bitcoin": "BTC",
+    "ethereum": "ETH",
+    "solana": "SOL",
+    "bnb": "BNB",
+    "xrp": "XRP",
+    "cardano": "ADA",
+}
+
 DISPLAY_NAMES = {
     "XAU/USD": "Gold",
     "XAG/USD": "Silver",
@@ -72,12 +102,25 @@ DISPLAY_NAMES = {
     "BNB/USD": "BNB",
     "XRP/USD": "XRP",
     "ADA/USD": "Cardano",
+    "^GSPC": "S&P 500",
+    "^IXIC": "NASDAQ Composite",
+    "^DJI": "Dow Jones Industrial Average",
+    "^RUT": "Russell 2000",
+    "^VIX": "CBOE Volatility Index",
+    "^N225": "Nikkei 225",
+    "^STOXX50E": "EURO STOXX 50",
+    "^FTSE": "FTSE 100",
+    "^GDAXI": "DAX",
+    "^HSI": "Hang Seng Index",
+    "000001.SS": "SSE Composite Index",
+    "^NSEI": "NIFTY 50",
 }
 
-_TD_TO_INTERNAL: dict[str, str] = {}
-for _mapping in [FX_SYMBOLS, COMMODITY_SYMBOLS, CRYPTO_SYMBOLS]:
-    for _key, _td_sym in _mapping.items():
-        _TD_TO_INTERNAL[_td_sym] = _key
+_TD_TO_INTERNAL: dict[str, str] = {
+    td_sym: key
+    for mapping in (FX_SYMBOLS, COMMODITY_SYMBOLS, CRYPTO_SYMBOLS)
+    for key, td_sym in mapping.items()
+}
 
 # --- yfinance symbol mappings (for indices that TD free tier can't do) ---
 
@@ -137,34 +180,248 @@ YFINANCE_COMMODITIES = {
 # Cache TTL in seconds
 CACHE_TTL = 300  # 5 minutes
 
+# Seconds fetch_fx waits for DXY after the pairs are in, and how long a
+# response without DXY is cached
+_DXY_GRACE = 3.0
+_DXY_MISS_TTL = _DXY_GRACE * 10
+
+# Twelve Data retries for throttling (429) and transient server errors
+_TD_MAX_ATTEMPTS = 3
+_TD_MAX_BACKOFF = 10.0
+_TD_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Cap concurrent Yahoo requests so throttling doesn't cascade into retries.
+# Blocking yfinance calls get their own pool sized to match, rather than
+# queueing behind other work on the loop's default executor.
+_YF_CONCURRENCY = 8
+_yf_sem: asyncio.Semaphore | None = None
+_yf_sem_loop: asyncio.AbstractEventLoop | None = None
+_YF_EXECUTOR = ThreadPoolExecutor(max_workers=_YF_CONCURRENCY, thread_name_prefix="yf")
+
+# PE ratio and dividend yield need the full Ticker.info scrape but change
+# slowly, so each symbol's are memoized per process for a day. Failed
+# scrapes (usually throttling) are memoized too, for a shorter time:
+# symbol -> (monotonic expiry, fields)
+_FUNDAMENTALS_TTL = 86400
+_FUNDAMENTALS_FAILURE_TTL = 600
+_FUNDAMENTALS: dict[str, tuple[float, dict[str, Any]]] = {}
+
+
+class _DiskCache:
+    """SQLite-backed TTL store shared by every worker process on the host.
+
+    Expiry uses wall-clock time since entries outlive the process. Values
+    are orjson-encoded. Methods block, so callers run them in a thread.
+    Failures (including corrupt rows) are logged and treated as misses so
+    a broken cache file never blocks live data.
+    """
+
+    # Seconds between sweeps of expired rows; reads already skip them
+    SWEEP_INTERVAL = 600.0
+
+    def __init__(self, path: str) -> None:
+        self._path = Path(path).expanduser()
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._next_sweep = 0.0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                self._path,
+                timeout=1.0,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            # WAL lets readers in other workers proceed during a write
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS live_cache "
+                "(key TEXT PRIMARY KEY, expires_at REAL, payload BLOB)"
+            )
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> tuple[float, Any] | None:
+        """Return ``(seconds_left, value)`` for a live entry, else None."""
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT expires_at, payload FROM live_cache WHERE key = ?",
+                    (key,),
+                ).fetchone()
+            if row is None:
+                return None
+            remaining = row[0] - time.time()
+            if remaining <= 0:
+                return None
+            return remaining, orjson.loads(row[1])
+        except Exception as e:
+            logger.warning("Live cache read failed for %s: %s", key, e)
+            return None
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        now = time.time()
+        try:
+            payload = orjson.dumps(value)
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO live_cache VALUES (?, ?, ?)",
+                    (key, now + ttl, payload),
+                )
+                if now >= self._next_sweep:
+                    conn.execute("DELETE FROM live_cache WHERE expires_at < ?", (now,))
+                    self._next_sweep = now + self.SWEEP_INTERVAL
+        except Exception as e:
+            logger.warning("Live cache write failed for %s: %s", key, e)
+
 
 class _MemCache:
-    """Simple in-memory TTL cache."""
+    """Bounded in-memory LRU cache with per-entry TTL.
+
+    Uses the monotonic clock so wall-clock jumps can't expire or revive
+    entries. Only touched from the event loop, so no locking is needed.
+    An optional ``_DiskCache`` acts as a second tier so restarts and
+    sibling workers start warm instead of refetching every symbol; it is
+    read and written in a worker thread, only on memory misses.
+    """
 
-    def __init__(self) -> None:
-        self._store: dict[str, tuple[float, Any]] = {}
+    MAX_ENTRIES = 512
+
+    def __init__(self, disk: _DiskCache | None = None) -> None:
+        self._store: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task[Any]] = {}
+        self._disk = disk
 
     def get(self, key: str) -> Any | None:
         entry = self._store.get(key)
         if entry is None:
             return None
-        ts, val = entry
-        if time.time() - ts > CACHE_TTL:
-            del self._store[key]
+        expires_at, val = entry
+        if time.monotonic() > expires_at:
+            self._store.pop(key, None)
             return None
+        self._store.move_to_end(key)
         return val
 
-    def set(self, key: str, value: Any) -> None:
-        self._store[key] = (time.time(), value)
-
-
-_cache = _MemCache()
+    def remaining(self, key: str) -> float:
+        """Seconds until ``key`` expires in memory; 0 if absent."""
+        entry = self._store.get(key)
+        return max(entry[0] - time.monotonic(), 0.0) if entry else 0.0
+
+    def set(self, key: str, value: Any, ttl: float = CACHE_TTL) -> None:
+        if key in self._store:
+            self._store.move_to_end(key)
+        elif len(self._store) >= self.MAX_ENTRIES:
+            self._store.popitem(last=False)
+        self._store[key] = (time.monotonic() + ttl, value)
+
+    async def get_or_compute(
+        self,
+        key: str,
+        factory: Callable[[], Awaitable[Any]],
+        cacheable: Callable[[Any], bool] = bool,
+        ttl: Callable[[Any], float] | None = None,
+    ) -> Any:
+        """Return the cached value, or run ``factory`` once for all waiters.
+
+        Concurrent misses on the same key share a single in-flight task,
+        which checks the disk tier before calling ``factory``. The result
+        is stored only if ``cacheable(result)`` is true, for ``ttl(result)``
+        seconds (default ``CACHE_TTL``).
+        """
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._compute(key, factory, cacheable, ttl))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _compute(
+        self,
+        key: str,
+        factory: Callable[[], Awaitable[Any]],
+        cacheable: Callable[[Any], bool],
+        ttl: Callable[[Any], float] | None,
+    ) -> Any:
+        if self._disk is not None:
+            hit = await asyncio.to_thread(self._disk.get, key)
+            if hit is not None:
+                remaining, value = hit
+                self.set(key, value, remaining)
+                return value
+
+        value = await factory()
+        if cacheable(value):
+            seconds = ttl(value) if ttl is not None else CACHE_TTL
+            self.set(key, value, seconds)
+            if self._disk is not None:
+                await asyncio.to_thread(self._disk.set, key, value, seconds)
+        return value
+
+
+_cache = _MemCache(_DiskCache(settings.live_cache_path))
+
+_td_http: httpx.AsyncClient | None = None
+_td_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _td_client() -> httpx.AsyncClient:
+    """Return the shared Twelve Data HTTP client, creating it on first use.
+
+    The pool is bound to an event loop, so a new client is made if the
+    caller runs on a different loop (e.g. one per Celery task).
+    """
+    global _td_http, _td_loop
+    loop = asyncio.get_running_loop()
+    if _td_http is None or _td_http.is_closed or _td_loop is not loop:
+        _td_http = httpx.AsyncClient(
+            base_url=BASE_URL,
+            http2=True,
+            timeout=httpx.Timeout(15.0, connect=3.0),
+            limits=httpx.Limits(
+                max_keepalive_connections=20,
+                max_connections=50,
+                keepalive_expiry=60,
+            ),
+        )
+        _td_loop = loop
+    return _td_http
+
+
+async def close() -> None:
+    """Close the shared Twelve Data HTTP client."""
+    global _td_http, _td_loop
+    if _td_http is not None:
+        await _td_http.aclose()
+        _td_http = None
+        _td_loop = None
 
 
 # ============================================================
 # Twelve Data helpers
 # ============================================================
 
+def _retry_delay(resp: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before retrying a throttled or failed request.
+
+    Honours ``Retry-After`` when the server sends one, otherwise uses
+    jittered exponential backoff; either way capped at ``_TD_MAX_BACKOFF``.
+    """
+    try:
+        delay = float(resp.headers["Retry-After"])
+    except (KeyError, ValueError):
+        delay = 2**attempt + random.random() * 0.5
+    return min(delay, _TD_MAX_BACKOFF)
+
+
 async def _fetch_quotes(symbols: list[str]) -> dict[str, dict]:
     """Batch-fetch quotes from Twelve Data /quote endpoint."""
     api_key = settings.twelve_data_api_key
@@ -174,10 +431,17 @@ async def _fetch_quotes(symbols: list[str]) -> dict[str, dict]:
     symbol_str = ",".join(symbols)
     params = {"symbol": symbol_str, "apikey": api_key}
 
-    async with httpx.AsyncClient(timeout=15) as client:
-        resp = await client.get(f"{BASE_URL}/quote", params=params)
-        resp.raise_for_status()
-        data = resp.json()
+    for attempt in range(_TD_MAX_ATTEMPTS):
+        resp = await _td_client().get("/quote", params=params)
+        if resp.status_code not in _TD_RETRY_STATUSES or attempt == _TD_MAX_ATTEMPTS - 1:
+            break
+        delay = _retry_delay(resp, attempt)
+        logger.warning(
+            "Twelve Data returned %s, retrying in %.1fs", resp.status_code, delay
+        )
+        await asyncio.sleep(delay)
+    resp.raise_for_status()
+    data = orjson.loads(resp.content)
 
     results: dict[str, dict] = {}
 
@@ -198,8 +462,32 @@ async def _fetch_quotes(symbols: list[str]) -> dict[str, dict]:
     return results
 
 
+# Every Twelve Data symbol any live view needs, fetched as one /quote batch
+# (one credit per symbol) so the snapshot and crypto views share a request.
+_TD_LIVE_SYMBOLS = [*CRYPTO_SYMBOLS.values(), "XAU/USD"]
+
+
+async def _fetch_live_quotes() -> dict[str, dict]:
+    """Return cached Twelve Data quotes for all live symbols."""
+    return await _cache.get_or_compute(
+        "td:all",
+        lambda: _fetch_quotes(_TD_LIVE_SYMBOLS),
+    )
+
+
+def _td_bound_ttl(_: Any) -> float:
+    """TTL for views built from ``td:all``: whatever that entry has left.
+
+    Otherwise a view built just before ``td:all`` expires would serve its
+    quotes for close to a second full ``CACHE_TTL``.
+    """
+    return min(_cache.remaining("td:all"), CACHE_TTL)
+
+
 def _pf(val: Any) -> float | None:
     """Safely parse a value to float."""
+    if type(val) is float:
+        return val
     if val is None or val == "" or val == "null":
         return None
     try:
@@ -208,9 +496,16 @@ def _pf(val: Any) -> float | None:
         return None
 
 
+def _fifty_two_week(q: dict) -> dict:
+    """Return the quote's ``fifty_two_week`` block, or an empty dict."""
+    fw = q.get("fifty_two_week")
+    return fw if isinstance(fw, dict) else {}
+
+
 def _td_to_fx(td_symbol: str, q: dict) -> dict:
     """Convert a Twelve Data quote to the FX pair dict shape."""
     pair_key = td_symbol.replace("/", "")
+    fw = _fifty_two_week(q)
     return {
         "pair": pair_key,
         "rate": _pf(q.get("close")),
@@ -218,8 +513,8 @@ def _td_to_fx(td_symbol: str, q: dict) -> dict:
         "change_percent": _pf(q.get("percent_change")),
         "day_high": _pf(q.get("high")),
         "day_low": _pf(q.get("low")),
-        "fifty_two_week_high": _pf(q.get("fifty_two_week", {}).get("high")) if isinstance(q.get("fifty_two_week"), dict) else None,
-        "fifty_two_week_low": _pf(q.get("fifty_two_week", {}).get("low")) if isinstance(q.get("fifty_two_week"), dict) else None,
+        "fifty_two_week_high": _pf(fw.get("high")),
+        "fifty_two_week_low": _pf(fw.get("low")),
         "timestamp": q.get("datetime", ""),
     }
 
@@ -228,6 +523,7 @@ def _td_to_commodity(td_symbol: str, q: dict) -> dict:
     """Convert a Twelve Data quote to the commodity dict shape."""
     internal_key = _TD_TO_INTERNAL.get(td_symbol, td_symbol)
     volume = _pf(q.get("volume"))
+    fw = _fifty_two_week(q)
     return {
         "symbol": internal_key,
         "name": q.get("name") or DISPLAY_NAMES.get(td_symbol, td_symbol),
@@ -237,8 +533,8 @@ def _td_to_commodity(td_symbol: str, q: dict) -> dict:
         "day_high": _pf(q.get("high")),
         "day_low": _pf(q.get("low")),
         "volume": int(volume) if volume else 0,
-        "fifty_two_week_high": _pf(q.get("fifty_two_week", {}).get("high")) if isinstance(q.get("fifty_two_week"), dict) else None,
-        "fifty_two_week_low": _pf(q.get("fifty_two_week", {}).get("low")) if isinstance(q.get("fifty_two_week"), dict) else None,
+        "fifty_two_week_high": _pf(fw.get("high")),
+        "fifty_two_week_low": _pf(fw.get("low")),
         "timestamp": q.get("datetime", ""),
     }
 
@@ -246,14 +542,10 @@ def _td_to_commodity(td_symbol: str, q: dict) -> dict:
 def _td_to_crypto(td_symbol: str, q: dict) -> dict:
     """Convert a Twelve Data quote to the crypto dict shape."""
     internal_key = _TD_TO_INTERNAL.get(td_symbol, td_symbol)
-    id_map = {"bitcoin": "bitcoin", "ethereum": "ethereum", "solana": "solana",
-              "bnb": "binancecoin", "xrp": "ripple", "cardano": "cardano"}
-    sym_map = {"bitcoin": "BTC", "ethereum": "ETH", "solana": "SOL",
-               "bnb": "BNB", "xrp": "XRP", "cardano": "ADA"}
     volume = _pf(q.get("volume"))
     return {
-        "id": id_map.get(internal_key, internal_key),
-        "symbol": sym_map.get(internal_key, td_symbol),
+        "id": CRYPTO_IDS.get(internal_key, internal_key),
+        "symbol": CRYPTO_TICKERS.get(internal_key, td_symbol),
         "name": q.get("name") or DISPLAY_NAMES.get(td_symbol, td_symbol),
         "current_price": _pf(q.get("close")),
         "market_cap": None,
@@ -278,20 +570,187 @@ def _td_to_crypto(td_symbol: str, q: dict) -> dict:
 # Direct yfinance helpers (bypass Redis, return plain dicts)
 # ============================================================
 
-async def _yf_quote(symbol: str) -> dict | None:
-    """Fetch a single yfinance quote as a plain dict."""
-    import yfinance as yf
+def _yf_semaphore() -> asyncio.Semaphore:
+    """Return the Yahoo concurrency cap for the running loop."""
+    global _yf_sem, _yf_sem_loop
+    loop = asyncio.get_running_loop()
+    if _yf_sem is None or _yf_sem_loop is not loop:
+        _yf_sem = asyncio.Semaphore(_YF_CONCURRENCY)
+        _yf_sem_loop = loop
+    return _yf_sem
+
+
+async def _run_yf(fn: Callable[..., Any], *args: Any) -> Any:
+    """Run a blocking yfinance call on the dedicated pool."""
+    async with _yf_semaphore():
+        return await asyncio.get_running_loop().run_in_executor(_YF_EXECUTOR, fn, *args)
+
+
+def _yf_download_bars(symbols: list[str]) -> dict[str, dict]:
+    """Download one year of daily bars for all symbols in a single request.
+
+    Blocking — call via ``_run_yf``. Returns the latest bar per
+    symbol plus previous close and 52-week range; symbols Yahoo returned
+    no rows for are omitted.
+    """
+    data = yf.download(
+        symbols,
+        period="1y",
+        interval="1d",
+        group_by="ticker",
+        threads=False,
+        progress=False,
+        auto_adjust=False,
+    )
+    if data is None or data.empty:
+        return {}
+
+    bars: dict[str, dict] = {}
+    for symbol in symbols:
+        try:
+            frame = data[symbol] if data.columns.nlevels > 1 else data
+        except KeyError:
+            continue
+        frame = frame.dropna(subset=["Close"])
+        if frame.empty:
+            continue
+        last = frame.iloc[-1]
+        closes = frame["Close"]
+        volume = last.get("Volume", 0)
+        bars[symbol] = {
+            "price": float(last["Close"]),
+            "previous_close": float(closes.iloc[-2]) if len(closes) > 1 else float(last["Close"]),
+            "open": float(last["Open"]),
+            "day_high": float(last["High"]),
+            "day_low": float(last["Low"]),
+            "volume": int(volume) if volume == volume else 0,  # NaN check
+            "fifty_two_week_high": float(frame["High"].max()),
+            "fifty_two_week_low": float(frame["Low"].min()),
+        }
+    return bars
+
+
+async def _yf_batch_quote(symbols: list[str]) -> dict[str, dict]:
+    """Fetch latest bars for many symbols with one yfinance download."""
+    try:
+        return await _run_yf(_yf_download_bars, symbols)
+    except Exception as e:
+        logger.warning("yfinance batch download failed for %d symbols: %s", len(symbols), e)
+        return {}
+
+
+def _change(price: float, prev: float) -> tuple[float, float]:
+    """Return (change, change_percent) between two prices."""
+    change = price - prev if price and prev else 0
+    pct = (change / prev * 100) if prev else 0
+    return change, pct
+
+
+def _bar_to_quote(
+    symbol: str,
+    bar: dict,
+    now_iso: str | None = None,
+    fundamentals: dict[str, Any] | None = None,
+) -> dict:
+    """Shape a batch bar like ``_yf_quote`` output."""
+    fundamentals = fundamentals or {}
+    change, pct = _change(bar["price"], bar["previous_close"])
+    return {
+        "symbol": symbol,
+        "name": DISPLAY_NAMES.get(symbol, symbol),
+        "current_price": bar["price"],
+        "previous_close": bar["previous_close"],
+        "open_price": bar["open"],
+        "day_high": bar["day_high"],
+        "day_low": bar["day_low"],
+        "volume": bar["volume"],
+        "change": round(change, 4),
+        "change_percent": round(pct, 4),
+        "fifty_two_week_high": bar["fifty_two_week_high"],
+        "fifty_two_week_low": bar["fifty_two_week_low"],
+        "market_cap": None,
+        "pe_ratio": fundamentals.get("pe_ratio"),
+        "dividend_yield": fundamentals.get("dividend_yield"),
+        "timestamp": now_iso or datetime.now(UTC).isoformat(),
+    }
+
+
+def _bar_to_fx(pair_name: str, bar: dict, now_iso: str | None = None) -> dict:
+    """Shape a batch bar like ``_yf_fx_pair`` output."""
+    change, pct = _change(bar["price"], bar["previous_close"])
+    return {
+        "pair": pair_name.upper(),
+        "rate": bar["price"],
+        "change": round(change, 6),
+        "change_percent": round(pct, 4),
+        "day_high": bar["day_high"],
+        "day_low": bar["day_low"],
+        "fifty_two_week_high": bar["fifty_two_week_high"],
+        "fifty_two_week_low": bar["fifty_two_week_low"],
+        "timestamp": now_iso or datetime.now(UTC).isoformat(),
+    }
+
 
+def _bar_to_commodity(
+    key: str,
+    name: str,
+    bar: dict,
+    now_iso: str | None = None,
+) -> dict:
+    """Shape a batch bar like ``_yf_commodity`` output."""
+    change, pct = _change(bar["price"], bar["previous_close"])
+    return {
+        "symbol": key,
+        "name": name,
+        "price": bar["price"],
+        "change": round(change, 4),
+        "change_percent": round(pct, 4),
+        "day_high": bar["day_high"],
+        "day_low": bar["day_low"],
+        "volume": bar["volume"],
+        "fifty_two_week_high": bar["fifty_two_week_high"],
+        "fifty_two_week_low": bar["fifty_two_week_low"],
+        "timestamp": now_iso or datetime.now(UTC).isoformat(),
+    }
+
+
+async def _yf_fundamentals(symbol: str) -> dict[str, Any]:
+    """Return ``pe_ratio``/``dividend_yield`` for a symbol, memoized daily."""
+    hit = _FUNDAMENTALS.get(symbol)
+    if hit is not None and time.monotonic() < hit[0]:
+        return hit[1]
     try:
-        ticker = yf.Ticker(symbol)
-        info = await asyncio.to_thread(lambda: ticker.info)
+        info = await _run_yf(getattr, yf.Ticker(symbol), "info")
+    except Exception as e:
+        logger.debug("yfinance fundamentals failed for %s: %s", symbol, e)
+        _FUNDAMENTALS[symbol] = (time.monotonic() + _FUNDAMENTALS_FAILURE_TTL, {})
+        return {}
+    fields = {
+        "pe_ratio": info.get("trailingPE"),
+        "dividend_yield": info.get("dividendYield"),
+    }
+    _FUNDAMENTALS[symbol] = (time.monotonic() + _FUNDAMENTALS_TTL, fields)
+    return fields
+
+
+async def _yf_quote(symbol: str, now_iso: str | None = None) -> dict | None:
+    """Fetch a single yfinance quote as a plain dict.
+
+    Prices come from ``fast_info``; PE ratio and dividend yield from the
+    daily fundamentals memo.
+    """
+    try:
+        info, stats = await asyncio.gather(
+            _run_yf(fetch_quote_info, symbol),
+            _yf_fundamentals(symbol),
+        )
         price = info.get("regularMarketPrice") or info.get("currentPrice", 0)
         prev = info.get("previousClose") or info.get("regularMarketPreviousClose", price)
         change = price - prev if price and prev else 0
         pct = (change / prev * 100) if prev else 0
         return {
             "symbol": symbol,
-            "name": info.get("shortName", info.get("longName", symbol)),
+            "name": info.get("shortName", info.get("longName", DISPLAY_NAMES.get(symbol, symbol))),
             "current_price": price,
             "previous_close": prev,
             "open_price": info.get("regularMarketOpen", info.get("open", 0)),
@@ -303,22 +762,19 @@ async def _yf_quote(symbol: str) -> dict | None:
             "fifty_two_week_high": info.get("fiftyTwoWeekHigh"),
             "fifty_two_week_low": info.get("fiftyTwoWeekLow"),
             "market_cap": info.get("marketCap"),
-            "pe_ratio": info.get("trailingPE"),
-            "dividend_yield": info.get("dividendYield"),
-            "timestamp": datetime.now(UTC).isoformat(),
+            "pe_ratio": stats.get("pe_ratio"),
+            "dividend_yield": stats.get("dividend_yield"),
+            "timestamp": now_iso or datetime.now(UTC).isoformat(),
         }
     except Exception as e:
         logger.warning("yfinance quote failed for %s: %s", symbol, e)
         return None
 
 
-async def _yf_dxy() -> dict | None:
+async def _yf_dxy(now_iso: str | None = None) -> dict | None:
     """Fetch DXY from yfinance as a plain dict."""
-    import yfinance as yf
-
     try:
-        ticker = yf.Ticker("DX-Y.NYB")
-        info = await asyncio.to_thread(lambda: ticker.info)
+        info = await _run_yf(fetch_quote_info, "DX-Y.NYB")
         value = info.get("regularMarketPrice") or info.get("ask", 0)
         prev = info.get("previousClose") or info.get("regularMarketPreviousClose", value)
         change = value - prev if value and prev else 0
@@ -329,20 +785,21 @@ async def _yf_dxy() -> dict | None:
             "change_percent": round(pct, 4),
             "day_high": info.get("regularMarketDayHigh", info.get("dayHigh", 0)),
             "day_low": info.get("regularMarketDayLow", info.get("dayLow", 0)),
-            "timestamp": datetime.now(UTC).isoformat(),
+            "timestamp": now_iso or datetime.now(UTC).isoformat(),
         }
     except Exception as e:
         logger.warning("yfinance DXY fetch failed: %s", e)
         return None
 
 
-async def _yf_fx_pair(pair_name: str, symbol: str) -> dict | None:
+async def _yf_fx_pair(
+    pair_name: str,
+    symbol: str,
+    now_iso: str | None = None,
+) -> dict | None:
     """Fetch a single FX pair from yfinance as a plain dict."""
-    import yfinance as yf
-
     try:
-        ticker = yf.Ticker(symbol)
-        info = await asyncio.to_thread(lambda: ticker.info)
+        info = await _run_yf(fetch_quote_info, symbol)
         rate = info.get("regularMarketPrice") or info.get("ask", 0)
         prev = info.get("previousClose") or info.get("regularMarketPreviousClose", rate)
         change = rate - prev if rate and prev else 0
@@ -356,20 +813,22 @@ async def _yf_fx_pair(pair_name: str, symbol: str) -> dict | None:
             "day_low": info.get("regularMarketDayLow", info.get("dayLow", 0)),
             "fifty_two_week_high": info.get("fiftyTwoWeekHigh"),
             "fifty_two_week_low": info.get("fiftyTwoWeekLow"),
-            "timestamp": datetime.now(UTC).isoformat(),
+            "timestamp": now_iso or datetime.now(UTC).isoformat(),
         }
     except Exception as e:
         logger.warning("yfinance FX pair %s failed: %s", pair_name, e)
         return None
 
 
-async def _yf_commodity(key: str, symbol: str, name: str) -> dict | None:
+async def _yf_commodity(
+    key: str,
+    symbol: str,
+    name: str,
+    now_iso: str | None = None,
+) -> dict | None:
     """Fetch a single commodity from yfinance as a plain dict."""
-    import yfinance as yf
-
     try:
-        ticker = yf.Ticker(symbol)
-        info = await asyncio.to_thread(lambda: ticker.info)
+        info = await _run_yf(fetch_quote_info, symbol)
         price = info.get("regularMarketPrice") or info.get("currentPrice", 0)
         prev = info.get("previousClose") or info.get("regularMarketPreviousClose", price)
         change = price - prev if price and prev else 0
@@ -386,7 +845,7 @@ async def _yf_commodity(key: str, symbol: str, name: str) -> dict | None:
             "volume": volume,
             "fifty_two_week_high": info.get("fiftyTwoWeekHigh"),
             "fifty_two_week_low": info.get("fiftyTwoWeekLow"),
-            "timestamp": datetime.now(UTC).isoformat(),
+            "timestamp": now_iso or datetime.now(UTC).isoformat(),
         }
     except Exception as e:
         logger.warning("yfinance commodity %s failed: %s", key, e)
@@ -399,20 +858,21 @@ async def _yf_commodity(key: str, symbol: str, name: str) -> dict | None:
 
 async def fetch_snapshot() -> dict[str, Any]:
     """Fetch quick snapshot: SPX, VIX, DXY from yfinance; BTC, Gold from Twelve Data."""
-    cache_key = "live:snapshot"
-    cached = _cache.get(cache_key)
-    if cached is not None:
-        return cached
+    return await _cache.get_or_compute(
+        "live:snapshot", _load_snapshot, ttl=_td_bound_ttl
+    )
+
 
+async def _load_snapshot() -> dict[str, Any]:
+    ts = datetime.now(UTC).isoformat()
     # Run yfinance (indices) and Twelve Data (crypto/commodities) in parallel
-    td_symbols = ["BTC/USD", "XAU/USD"]
     yf_tasks = {
-        "spx": _yf_quote("^GSPC"),
-        "vix": _yf_quote("^VIX"),
-        "dxy": _yf_dxy(),
+        "spx": _yf_quote("^GSPC", now_iso=ts),
+        "vix": _yf_quote("^VIX", now_iso=ts),
+        "dxy": _yf_dxy(now_iso=ts),
     }
 
-    td_task = _fetch_quotes(td_symbols)
+    td_task = _fetch_live_quotes()
 
     all_results = await asyncio.gather(
         *yf_tasks.values(),
@@ -440,180 +900,184 @@ async def fetch_snapshot() -> dict[str, Any]:
 
     result["yield_curve"] = None
 
-    if result:
-        _cache.set(cache_key, result)
     return result
 
 
 async def fetch_equities() -> dict[str, Any]:
     """Fetch US + global equity indices and sectors via yfinance."""
-    cache_key = "live:equities"
-    cached = _cache.get(cache_key)
-    if cached is not None:
-        return cached
+    return await _cache.get_or_compute(
+        "live:equities",
+        _load_equities,
+        cacheable=lambda r: bool(r["us"]),
+    )
+
 
+async def _load_equities() -> dict[str, Any]:
+    ts = datetime.now(UTC).isoformat()
     us_keys = ["spx", "nasdaq", "dow", "russell2000"]
     global_keys = ["nikkei", "eurostoxx50", "ftse100", "dax", "hang_seng", "shanghai", "nifty50"]
 
-    # Build all tasks
-    tasks: dict[str, Any] = {}
-    for key in us_keys + global_keys + ["vix"]:
-        tasks[key] = _yf_quote(YFINANCE_INDICES[key])
-    for sector, etf in SECTOR_ETFS.items():
-        tasks[f"sector_{sector}"] = _yf_quote(etf)
+    symbols = {key: YFINANCE_INDICES[key] for key in us_keys + global_keys + ["vix"]}
+    symbols.update(SECTOR_ETFS)
 
-    all_results = await asyncio.gather(*tasks.values(), return_exceptions=True)
-    result_map = dict(zip(tasks.keys(), all_results))
+    bars = await _yf_batch_quote(list(symbols.values()))
 
-    us: dict[str, dict] = {}
-    for key in us_keys:
-        val = result_map.get(key)
-        if isinstance(val, dict):
-            us[key] = val
+    # Per-symbol fallback for anything the batch download missed, alongside
+    # fundamentals for the indices the batch did return
+    missing = [key for key, sym in symbols.items() if sym not in bars]
+    index_keys = [key for key in us_keys + global_keys if symbols[key] in bars]
+    results = await asyncio.gather(
+        *(_yf_quote(symbols[key], now_iso=ts) for key in missing),
+        *(_yf_fundamentals(symbols[key]) for key in index_keys),
+        return_exceptions=True,
+    )
+    fallback_map = dict(zip(missing, results[: len(missing)]))
+    fundamentals_map = {
+        key: val
+        for key, val in zip(index_keys, results[len(missing) :])
+        if isinstance(val, dict)
+    }
 
+    us: dict[str, dict] = {}
     global_indices: dict[str, dict] = {}
-    for key in global_keys:
-        val = result_map.get(key)
-        if isinstance(val, dict):
-            global_indices[key] = val
-
     sectors: dict[str, float] = {}
-    for sector in SECTOR_ETFS:
-        val = result_map.get(f"sector_{sector}")
-        if isinstance(val, dict):
-            sectors[sector] = val.get("change_percent", 0)
-
-    vix_val = result_map.get("vix")
-    vix_data = vix_val if isinstance(vix_val, dict) else None
+    vix_data: dict | None = None
+    for key, sym in symbols.items():
+        if sym in bars:
+            val = _bar_to_quote(sym, bars[sym], ts, fundamentals_map.get(key))
+        else:
+            val = fallback_map.get(key)
+        if not isinstance(val, dict):
+            continue
+        if key in SECTOR_ETFS:
+            sectors[key] = val.get("change_percent", 0)
+        elif key == "vix":
+            vix_data = val
+        elif key in us_keys:
+            us[key] = val
+        else:
+            global_indices[key] = val
 
-    result = {
+    return {
         "us": us,
         "global": global_indices,
         "sectors": sectors,
         "vix": vix_data,
     }
 
-    if us:
-        _cache.set(cache_key, result)
-    return result
-
 
 async def fetch_fx() -> dict[str, Any]:
     """Fetch FX pairs and DXY from yfinance."""
-    cache_key = "live:fx"
-    cached = _cache.get(cache_key)
-    if cached is not None:
-        return cached
+    return await _cache.get_or_compute(
+        "live:fx",
+        _load_fx,
+        cacheable=lambda r: bool(r["pairs"]),
+        # A missed DXY shouldn't stick for the full TTL on every worker
+        ttl=lambda r: CACHE_TTL if r["dxy"] is not None else _DXY_MISS_TTL,
+    )
 
-    # All yfinance — no TD credits used
-    tasks: dict[str, Any] = {}
-    for key, symbol in YFINANCE_FX.items():
-        tasks[key] = _yf_fx_pair(key, symbol)
-    tasks["dxy"] = _yf_dxy()
 
-    all_results = await asyncio.gather(*tasks.values(), return_exceptions=True)
-    result_map = dict(zip(tasks.keys(), all_results))
+async def _load_fx() -> dict[str, Any]:
+    ts = datetime.now(UTC).isoformat()
 
-    pairs: dict[str, dict] = {}
-    for key in YFINANCE_FX:
-        val = result_map.get(key)
-        if isinstance(val, dict):
-            pairs[key] = val
+    # All yfinance — no TD credits used.
+    # DXY runs alongside the pairs but can't hold them up past _DXY_GRACE
+    dxy_task = asyncio.create_task(_yf_dxy(now_iso=ts))
+    bars = await _yf_batch_quote(list(YFINANCE_FX.values()))
 
-    dxy = result_map.get("dxy") if isinstance(result_map.get("dxy"), dict) else None
+    missing = [key for key, symbol in YFINANCE_FX.items() if symbol not in bars]
+    fallback = await asyncio.gather(
+        *(_yf_fx_pair(key, YFINANCE_FX[key], now_iso=ts) for key in missing),
+        return_exceptions=True,
+    )
+    fallback_map = dict(zip(missing, fallback))
 
-    # Compute USD strength index
+    # Build pairs and the USD strength index in one pass
+    pairs: dict[str, dict] = {}
     usd_strength_vals = []
-    for key, pair_data in pairs.items():
-        pct = pair_data.get("change_percent")
+    for key, symbol in YFINANCE_FX.items():
+        val = _bar_to_fx(key, bars[symbol], ts) if symbol in bars else fallback_map.get(key)
+        if not isinstance(val, dict):
+            continue
+        pairs[key] = val
+        pct = val.get("change_percent")
         if pct is not None:
-            if key.startswith("usd"):
-                usd_strength_vals.append(pct)
-            else:
-                usd_strength_vals.append(-pct)
+            usd_strength_vals.append(pct if key.startswith("usd") else -pct)
     avg_usd = sum(usd_strength_vals) / len(usd_strength_vals) if usd_strength_vals else None
 
-    result = {
+    try:
+        dxy = await asyncio.wait_for(dxy_task, timeout=_DXY_GRACE)
+    except TimeoutError:
+        logger.warning("DXY fetch exceeded %.0fs, returning pairs without it", _DXY_GRACE)
+        dxy = None
+
+    return {
         "dxy": dxy,
         "pairs": pairs,
         "usd_strength_index": round(avg_usd, 4) if avg_usd is not None else None,
-        "timestamp": datetime.now(UTC).isoformat(),
+        "timestamp": ts,
     }
 
-    if pairs:
-        _cache.set(cache_key, result)
-    return result
-
 
 async def fetch_commodities() -> dict[str, Any]:
     """Fetch commodity prices from yfinance."""
-    cache_key = "live:commodities"
-    cached = _cache.get(cache_key)
-    if cached is not None:
-        return cached
+    return await _cache.get_or_compute(
+        "live:commodities",
+        _load_commodities,
+        cacheable=lambda r: bool(r["precious_metals"] or r["energy"]),
+    )
 
+
+async def _load_commodities() -> dict[str, Any]:
+    ts = datetime.now(UTC).isoformat()
     # All yfinance — no TD credits used
-    tasks: dict[str, Any] = {}
-    for key, (symbol, name, _) in YFINANCE_COMMODITIES.items():
-        tasks[key] = _yf_commodity(key, symbol, name)
-
-    all_results = await asyncio.gather(*tasks.values(), return_exceptions=True)
-    result_map = dict(zip(tasks.keys(), all_results))
-
-    precious: dict[str, dict] = {}
-    energy: dict[str, dict] = {}
-    agriculture: dict[str, dict] = {}
-    industrial: dict[str, dict] = {}
-
-    category_buckets = {
-        "precious_metals": precious,
-        "energy": energy,
-        "agriculture": agriculture,
-        "industrial": industrial,
-    }
+    bars = await _yf_batch_quote([symbol for symbol, _, _ in YFINANCE_COMMODITIES.values()])
 
-    for key, (_, _, category) in YFINANCE_COMMODITIES.items():
-        val = result_map.get(key)
-        if isinstance(val, dict):
-            category_buckets[category][key] = val
-
-    result = {
-        "precious_metals": precious,
-        "energy": energy,
-        "agriculture": agriculture,
-        "industrial": industrial,
-        "timestamp": datetime.now(UTC).isoformat(),
+    missing = [key for key, (symbol, _, _) in YFINANCE_COMMODITIES.items() if symbol not in bars]
+    fallback = await asyncio.gather(
+        *(_yf_commodity(key, *YFINANCE_COMMODITIES[key][:2], now_iso=ts) for key in missing),
+        return_exceptions=True,
+    )
+    fallback_map = dict(zip(missing, fallback))
+
+    buckets: dict[str, dict[str, dict]] = {
+        "precious_metals": {},
+        "energy": {},
+        "agriculture": {},
+        "industrial": {},
     }
+    for key, (symbol, name, category) in YFINANCE_COMMODITIES.items():
+        if symbol in bars:
+            val = _bar_to_commodity(key, name, bars[symbol], ts)
+        else:
+            val = fallback_map.get(key)
+        if isinstance(val, dict):
+            buckets[category][key] = val
 
-    if precious or energy:
-        _cache.set(cache_key, result)
-    return result
+    return {**buckets, "timestamp": ts}
 
 
 async def fetch_crypto() -> dict[str, Any]:
     """Fetch crypto prices from Twelve Data."""
-    cache_key = "live:crypto"
-    cached = _cache.get(cache_key)
-    if cached is not None:
-        return cached
+    return await _cache.get_or_compute(
+        "live:crypto",
+        _load_crypto,
+        cacheable=lambda r: bool(r["assets"]),
+        ttl=_td_bound_ttl,
+    )
 
-    quotes = await _fetch_quotes(list(CRYPTO_SYMBOLS.values()))
 
-    id_map = {"bitcoin": "bitcoin", "ethereum": "ethereum", "solana": "solana",
-              "bnb": "binancecoin", "xrp": "ripple", "cardano": "cardano"}
+async def _load_crypto() -> dict[str, Any]:
+    quotes = await _fetch_live_quotes()
 
     assets: dict[str, dict] = {}
     for key, td_sym in CRYPTO_SYMBOLS.items():
-        asset_key = id_map.get(key, key)
+        asset_key = CRYPTO_IDS.get(key, key)
         if td_sym in quotes:
             assets[asset_key] = _td_to_crypto(td_sym, quotes[td_sym])
 
-    result = {
+    return {
         "assets": assets,
         "market_overview": None,
         "fear_greed": None,
     }
-
-    if assets:
-        _cache.set(cache_key, result)
-    return result
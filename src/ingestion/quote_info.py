@@ -0,0 +1,44 @@
+"""Lightweight yfinance quote lookups via ``Ticker.fast_info``."""
+
+import logging
+from typing import Any
+
+import yfinance as yf
+
+logger = logging.getLogger(__name__)
+
+# fast_info attribute -> Ticker.info key, so callers can keep using info keys
+_FAST_INFO_KEYS = {
+    "last_price": "regularMarketPrice",
+    "previous_close": "previousClose",
+    "open": "regularMarketOpen",
+    "day_high": "regularMarketDayHigh",
+    "day_low": "regularMarketDayLow",
+    "last_volume": "regularMarketVolume",
+    "year_high": "fiftyTwoWeekHigh",
+    "year_low": "fiftyTwoWeekLow",
+}
+
+
+def fetch_quote_info(symbol: str) -> dict[str, Any]:
+    """Return an ``info``-shaped dict built from ``fast_info``.
+
+    ``fast_info`` reads the chart endpoint instead of scraping the full
+    quote page; fields it lacks (names, ratios) are absent. Falls back to
+    ``Ticker.info`` if the fast path fails. Blocking — call via
+    ``asyncio.to_thread``.
+    """
+    ticker = yf.Ticker(symbol)
+    try:
+        fast = ticker.fast_info
+        info = {key: fast[attr] for attr, key in _FAST_INFO_KEYS.items()}
+    except Exception as e:
+        logger.debug("fast_info failed for %s, falling back to info: %s", symbol, e)
+        return ticker.info
+
+    # Indices and FX have no share count, so market cap may be unavailable
+    try:
+        info["marketCap"] = fast["market_cap"]
+    except Exception:
+        info["marketCap"] = None
+    return info
@@ -4,8 +4,11 @@ import asyncio
 import time
 from dataclasses import dataclass, field
 
+# Bound once so the hot refill path skips the module attribute lookup
+_monotonic = time.monotonic
 
-@dataclass
+
+@dataclass(slots=True)
 class RateLimiter:
     """Token bucket rate limiter.
 
@@ -24,7 +27,7 @@ class RateLimiter:
 
     def __post_init__(self) -> None:
         self.tokens = self.capacity
-        self.last_update = time.monotonic()
+        self.last_update = _monotonic()
 
     @classmethod
     def from_per_minute(cls, requests_per_minute: int) -> "RateLimiter":
@@ -32,11 +35,14 @@ class RateLimiter:
         rate = requests_per_minute / 60.0
         return cls(rate=rate, capacity=float(requests_per_minute))
 
+    def _projected(self, now: float) -> float:
+        """Tokens the bucket would hold at ``now``, without updating state."""
+        return min(self.capacity, self.tokens + (now - self.last_update) * self.rate)
+
     def _refill(self) -> None:
         """Refill tokens based on elapsed time."""
-        now = time.monotonic()
-        elapsed = now - self.last_update
-        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        now = _monotonic()
+        self.tokens = self._projected(now)
         self.last_update = now
 
     async def acquire(self, tokens: float = 1.0) -> float:
@@ -45,42 +51,46 @@ class RateLimiter:
         Returns:
             Wait time in seconds (0 if no wait needed)
         """
-        async with self._lock:
-            self._refill()
+        waited = 0.0
+        while True:
+            async with self._lock:
+                self._refill()
 
-            if self.tokens >= tokens:
-                self.tokens -= tokens
-                return 0.0
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return waited
 
-            # Calculate wait time
-            deficit = tokens - self.tokens
-            wait_time = deficit / self.rate
+                # Calculate wait time
+                deficit = tokens - self.tokens
+                wait_time = deficit / self.rate
 
-            # Wait and refill
+            # Sleep outside the lock so other callers can still check tokens
             await asyncio.sleep(wait_time)
-            self._refill()
-            self.tokens -= tokens
-
-            return wait_time
+            waited += wait_time
 
     def try_acquire(self, tokens: float = 1.0) -> bool:
         """Try to acquire tokens without waiting.
 
+        Synchronous and free of awaits, so it cannot interleave with
+        ``acquire`` on the event loop and needs no lock. State is only
+        written when tokens are actually taken.
+
         Returns:
             True if tokens acquired, False otherwise
         """
-        self._refill()
+        now = _monotonic()
+        available = self._projected(now)
+        if available < tokens:
+            return False
 
-        if self.tokens >= tokens:
-            self.tokens -= tokens
-            return True
-        return False
+        self.tokens = available - tokens
+        self.last_update = now
+        return True
 
     @property
     def available_tokens(self) -> float:
-        """Get current available tokens."""
-        self._refill()
-        return self.tokens
+        """Get current available tokens (read-only)."""
+        return self._projected(_monotonic())
 
 
 class RateLimiterRegistry:
@@ -90,10 +100,17 @@ class RateLimiterRegistry:
 
     @classmethod
     def get(cls, name: str, requests_per_minute: int = 60) -> RateLimiter:
-        """Get or create a rate limiter by name."""
-        if name not in cls._limiters:
-            cls._limiters[name] = RateLimiter.from_per_minute(requests_per_minute)
-        return cls._limiters[name]
+        """Get or create a rate limiter by name.
+
+        ``setdefault`` makes creation a single dict operation, so concurrent
+        first callers all end up sharing the same limiter.
+        """
+        limiter = cls._limiters.get(name)
+        if limiter is None:
+            limiter = cls._limiters.setdefault(
+                name, RateLimiter.from_per_minute(requests_per_minute)
+            )
+        return limiter
 
     @classmethod
     def reset(cls, name: str | None = None) -> None:
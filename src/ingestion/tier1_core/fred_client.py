@@ -1,16 +1,80 @@
 """FRED (Federal Reserve Economic Data) API client."""
 
 import asyncio
+import random
+import time
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
+import aiohttp
+import numpy as np
 import pandas as pd
-from fredapi import Fred
 
 from src.config.constants import FRED_SERIES
 from src.config.settings import settings
 from src.ingestion.base import DataSource
 
+FRED_BASE_URL = "https://api.stlouisfed.org"
+
+# Retry policy for throttled (429) and transient 5xx responses
+_FRED_MAX_ATTEMPTS = 3
+_FRED_MAX_BACKOFF = 10.0
+_FRED_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Series metadata memo: series_id -> (monotonic fetch time, info)
+_INFO_TTL = 86400  # 1 day
+_INFO_CACHE: dict[str, tuple[float, dict[str, Any]]] = {}
+
+# Shared pooled session; clients are created per request, the session is not
+_session: aiohttp.ClientSession | None = None
+_session_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _get_session() -> aiohttp.ClientSession:
+    """Return the shared FRED session, creating it on first use.
+
+    Sessions are bound to an event loop, so a new one is made if the
+    caller runs on a different loop (e.g. one ``asyncio.run`` per task).
+    """
+    global _session, _session_loop
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        _session = aiohttp.ClientSession(
+            base_url=FRED_BASE_URL,
+            timeout=aiohttp.ClientTimeout(total=30),
+            connector=aiohttp.TCPConnector(limit=8, keepalive_timeout=60),
+        )
+        _session_loop = loop
+    return _session
+
+
+async def close() -> None:
+    """Close the shared FRED session."""
+    global _session, _session_loop
+    if _session is not None:
+        await _session.close()
+        _session = None
+        _session_loop = None
+
+
+def _retry_delay(resp: aiohttp.ClientResponse, attempt: int) -> float:
+    """Seconds to wait before retrying, honouring ``Retry-After`` if sent."""
+    try:
+        delay = float(resp.headers["Retry-After"])
+    except (KeyError, ValueError):
+        delay = 2**attempt + random.random() * 0.5
+    return min(delay, _FRED_MAX_BACKOFF)
+
+
+def _parse_observations(observations: list[dict[str, str]]) -> pd.Series:
+    """Build a date-indexed float series; FRED marks missing values as '.'."""
+    index = pd.to_datetime([o["date"] for o in observations], format="%Y-%m-%d")
+    values = np.array(
+        [np.nan if o["value"] == "." else float(o["value"]) for o in observations],
+        dtype=float,
+    )
+    return pd.Series(values, index=index)
+
 
 class FREDData:
     """Container for FRED data."""
@@ -30,26 +94,25 @@ class FREDData:
         self.units = units
         self.frequency = frequency
         self.last_updated = last_updated or datetime.now(UTC)
+        # The series is fixed once fetched, so read the last two points once
+        self._latest = float(data.iloc[-1]) if len(data) else None
+        self._previous = float(data.iloc[-2]) if len(data) >= 2 else None
 
     @property
     def latest_value(self) -> float | None:
         """Get most recent value."""
-        if self.data.empty:
-            return None
-        return float(self.data.iloc[-1])
+        return self._latest
 
     @property
     def previous_value(self) -> float | None:
         """Get previous value."""
-        if len(self.data) < 2:
-            return None
-        return float(self.data.iloc[-2])
+        return self._previous
 
     @property
     def change(self) -> float | None:
         """Get change from previous value."""
-        latest = self.latest_value
-        previous = self.previous_value
+        latest = self._latest
+        previous = self._previous
         if latest is None or previous is None:
             return None
         return latest - previous
@@ -57,8 +120,8 @@ class FREDData:
     @property
     def pct_change(self) -> float | None:
         """Get percentage change from previous value."""
-        latest = self.latest_value
-        previous = self.previous_value
+        latest = self._latest
+        previous = self._previous
         if latest is None or previous is None or previous == 0:
             return None
         return ((latest - previous) / previous) * 100
@@ -89,25 +152,64 @@ class FREDClient(DataSource[dict[str, FREDData]]):
         super().__init__()
         api_key = settings.fred_api_key
         if api_key:
-            self._client = Fred(api_key=api_key.get_secret_value())
+            self._api_key: str | None = api_key.get_secret_value()
         else:
-            self._client = None
+            self._api_key = None
             self.logger.warning("FRED API key not configured")
 
+    async def _get(self, path: str, **params: Any) -> dict[str, Any]:
+        """GET a FRED REST endpoint and return the decoded JSON."""
+        params.update(api_key=self._api_key, file_type="json")
+        session = _get_session()
+        for attempt in range(_FRED_MAX_ATTEMPTS - 1):
+            async with session.get(path, params=params) as resp:
+                if resp.status not in _FRED_RETRY_STATUSES:
+                    resp.raise_for_status()
+                    return await resp.json()
+                delay = _retry_delay(resp, attempt)
+            self.logger.warning(f"FRED returned {resp.status}, retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+        async with session.get(path, params=params) as resp:
+            resp.raise_for_status()
+            return await resp.json()
+
+    async def _get_observations(self, series_id: str, **params: Any) -> pd.Series:
+        """Fetch observations for a series as a date-indexed float series."""
+        payload = await self._get(
+            "/fred/series/observations", series_id=series_id, **params
+        )
+        return _parse_observations(payload.get("observations", []))
+
     async def health_check(self) -> bool:
         """Check FRED API availability."""
-        if not self._client:
+        if not self._api_key:
             return False
         try:
             # Try to fetch a simple series
-            await asyncio.to_thread(
-                self._client.get_series, "DGS10", limit=1
-            )
+            await self._get_observations("DGS10", limit=1)
             return True
         except Exception as e:
             self.logger.error(f"FRED health check failed: {e}")
             return False
 
+    async def _get_info(self, series_id: str) -> dict[str, Any]:
+        """Get series metadata, memoized per process for a day.
+
+        Titles, units and frequency change on the order of months, so this
+        saves the second FRED request on every series fetch.
+        """
+        now = time.monotonic()
+        hit = _INFO_CACHE.get(series_id)
+        if hit is not None and now - hit[0] < _INFO_TTL:
+            return hit[1]
+
+        payload = await self._get("/fred/series", series_id=series_id)
+        seriess = payload.get("seriess") or [{}]
+        info = seriess[0]
+        _INFO_CACHE[series_id] = (now, info)
+        return info
+
     async def fetch_latest(self) -> dict[str, FREDData] | None:
         """Fetch latest data for all configured series."""
         return await self.fetch_multiple(list(FRED_SERIES.keys()))
@@ -128,7 +230,7 @@ class FREDClient(DataSource[dict[str, FREDData]]):
         Returns:
             FREDData object or None if error
         """
-        if not self._client:
+        if not self._api_key:
             self.logger.error("FRED client not initialized")
             return None
 
@@ -137,23 +239,25 @@ class FREDClient(DataSource[dict[str, FREDData]]):
             self.logger.error(f"Unknown series name: {series_name}")
             return None
 
-        # Default to last 2 years of data
+        # Default to last 2 years of data. FRED only takes dates, so bounds
+        # are keyed by day and every call on the same day shares a cache entry
+        today = datetime.now(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
         if start_date is None:
-            start_date = datetime.now() - timedelta(days=730)
+            start_date = today - timedelta(days=730)
         if end_date is None:
-            end_date = datetime.now()
+            end_date = today
+        start = start_date.strftime("%Y-%m-%d")
+        end = end_date.strftime("%Y-%m-%d")
 
         async def _fetch() -> FREDData | None:
             try:
-                data = await asyncio.to_thread(
-                    self._client.get_series,
-                    series_id,
-                    observation_start=start_date,
-                    observation_end=end_date,
-                )
-
-                info = await asyncio.to_thread(
-                    self._client.get_series_info, series_id
+                data, info = await asyncio.gather(
+                    self._get_observations(
+                        series_id,
+                        observation_start=start,
+                        observation_end=end,
+                    ),
+                    self._get_info(series_id),
                 )
 
                 return FREDData(
@@ -172,8 +276,8 @@ class FREDClient(DataSource[dict[str, FREDData]]):
             "fetch_series",
             _fetch,
             series_name,
-            start_date=start_date.isoformat() if start_date else None,
-            end_date=end_date.isoformat() if end_date else None,
+            start_date=start,
+            end_date=end,
         )
 
     async def fetch_multiple(
@@ -1,15 +1,20 @@
 """Reddit sentiment analysis client using public JSON API (no auth required)."""
 
 import asyncio
+import hashlib
 import logging
 import re
 import time
-from collections import Counter
+from collections import Counter, OrderedDict
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any
 
+import ahocorasick
 import httpx
+import numpy as np
+import orjson
 
 from src.config.constants import REDDIT_SUBREDDITS
 from src.config.settings import settings
@@ -17,7 +22,7 @@ from src.config.settings import settings
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class RedditPost:
     """Reddit post data."""
 
@@ -25,7 +30,7 @@ class RedditPost:
     subreddit: str
     score: int
     num_comments: int
-    created_utc: datetime
+    created_utc: float  # epoch seconds; converted only when serialized
     url: str
     is_self: bool
     selftext: str = ""
@@ -37,14 +42,14 @@ class RedditPost:
             "subreddit": self.subreddit,
             "score": self.score,
             "num_comments": self.num_comments,
-            "created_utc": self.created_utc.isoformat(),
+            "created_utc": datetime.fromtimestamp(self.created_utc, tz=UTC).isoformat(),
             "url": self.url,
             "is_self": self.is_self,
             "tickers": self.tickers,
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SubredditSentiment:
     """Sentiment data for a subreddit."""
 
@@ -73,29 +78,121 @@ class SubredditSentiment:
 # ── In-memory TTL cache (same pattern as twelve_data_client) ──
 
 class _MemCache:
+    """Bounded in-memory LRU cache; entries store their expiry time."""
+
+    MAX_ENTRIES = 128
+
     def __init__(self, ttl: int = 300):
-        self._store: dict[str, tuple[float, Any]] = {}
+        self._store: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task[Any]] = {}
         self._ttl = ttl
 
     def get(self, key: str) -> Any | None:
         entry = self._store.get(key)
-        if entry and (time.monotonic() - entry[0]) < self._ttl:
-            return entry[1]
-        return None
+        if entry is None:
+            return None
+        expires_at, val = entry
+        if time.monotonic() > expires_at:
+            self._store.pop(key, None)
+            return None
+        self._store.move_to_end(key)
+        return val
 
     def set(self, key: str, value: Any) -> None:
-        self._store[key] = (time.monotonic(), value)
+        if key in self._store:
+            self._store.move_to_end(key)
+        elif len(self._store) >= self.MAX_ENTRIES:
+            self._store.popitem(last=False)
+        self._store[key] = (time.monotonic() + self._ttl, value)
+
+    async def get_or_compute(
+        self,
+        key: str,
+        factory: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Return the cached value, or run ``factory`` once for all waiters.
+
+        Concurrent misses on the same key share a single in-flight task;
+        only truthy results are stored.
+        """
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._compute(key, factory))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _compute(self, key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+        value = await factory()
+        if value:
+            self.set(key, value)
+        return value
 
 
 _cache = _MemCache(ttl=settings.cache_ttl_reddit)
 
+_HEADERS = {
+    "User-Agent": settings.reddit_user_agent,
+}
+# Reddit gets its own small connection pool so a burst of subreddit
+# fetches queues here instead of competing with the other tiers. With
+# HTTP/2 the subreddit GETs multiplex over one kept-alive connection.
+_MAX_CONNECTIONS = 4
+
+# Shared across RedditClient instances so connections outlive each client
+_http: httpx.AsyncClient | None = None
+_http_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _reddit_http() -> httpx.AsyncClient:
+    """Return the shared Reddit HTTP client, creating it on first use.
+
+    Pooled connections are bound to an event loop, so a new client is
+    made if the caller runs on a different loop (e.g. Celery tasks).
+    """
+    global _http, _http_loop
+    loop = asyncio.get_running_loop()
+    if _http is None or _http.is_closed or _http_loop is not loop:
+        _http = httpx.AsyncClient(
+            headers=_HEADERS,
+            timeout=15.0,
+            follow_redirects=True,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=_MAX_CONNECTIONS,
+                max_keepalive_connections=_MAX_CONNECTIONS,
+                keepalive_expiry=60,
+            ),
+        )
+        _http_loop = loop
+    return _http
+
+
+async def close() -> None:
+    """Close the shared Reddit HTTP client."""
+    global _http, _http_loop
+    if _http is not None:
+        await _http.aclose()
+        _http = None
+        _http_loop = None
+
+
+def _keyword_automaton(sides: dict[str, int]) -> ahocorasick.Automaton:
+    """Build an Aho-Corasick automaton mapping each keyword to (kw, side)."""
+    automaton = ahocorasick.Automaton()
+    for kw, side in sides.items():
+        automaton.add_word(kw, (kw, side))
+    automaton.make_automaton()
+    return automaton
+
 
 class RedditClient:
     """Reddit client using public JSON API — no credentials required."""
 
-    # Ticker pattern: $SYMBOL or standalone 2-5 letter uppercase
-    TICKER_PATTERN = re.compile(r"\$([A-Z]{1,5})\b|\b([A-Z]{2,5})\b")
-
     COMMON_WORDS = frozenset({
         "I", "A", "THE", "TO", "AND", "OR", "FOR", "IS", "IT", "DD", "OP",
         "CEO", "CFO", "IPO", "ETF", "GDP", "CPI", "FED", "SEC", "US", "UK",
@@ -114,32 +211,39 @@ class RedditClient:
         "ERC", "EIP", "EIPS", "BIP", "MPC", "AA", "VIP", "SMS", "GMT",
         "NFL", "GPU", "CUDA", "WASM", "ECDSA", "OWASP", "HODL", "SELL",
         "SPAC", "UMAC", "FOCIL", "EF", "USD", "EUR", "GBP", "JPY", "CAD",
-        "BUY", "CALL", "PUT", "ETF", "REIT", "CEO", "COO", "CTO",
+        "BUY", "CALL", "PUT", "REIT", "COO", "CTO",
     })
 
-    BULLISH_KEYWORDS = [
+    # Ticker pattern: $SYMBOL (1-5 letters) or standalone 2-5 letter
+    # uppercase, in one capture group. COMMON_WORDS is rejected inside the
+    # regex by a negative lookahead.
+    _STOP_WORDS = "|".join(sorted(COMMON_WORDS))
+    TICKER_PATTERN = re.compile(
+        rf"(?:\$|\b(?=[A-Z]{{2}}))(?!(?:{_STOP_WORDS})\b)([A-Z]{{1,5}})\b"
+    )
+
+    BULLISH_KEYWORDS = (
         "buy", "calls", "moon", "rocket", "bullish", "long", "yolo",
         "tendies", "gain", "pump", "breakout", "squeeze", "diamond hands",
         "hold", "hodl", "to the moon", "going up", "undervalued",
         "rally", "rip", "green", "soar", "surge",
-    ]
-    BEARISH_KEYWORDS = [
+    )
+    BEARISH_KEYWORDS = (
         "sell", "puts", "crash", "bearish", "short", "dump", "tank",
         "loss", "drop", "overvalued", "bubble", "paper hands",
         "going down", "red", "blood", "correction", "plunge",
         "bear", "fade", "drill",
-    ]
-
-    _HEADERS = {
-        "User-Agent": settings.reddit_user_agent,
+    )
+
+    # +1 bullish / -1 bearish, and one automaton over every keyword so a
+    # post is scanned once. iter_long takes leftmost-longest matches, so
+    # overlapping phrases ("to the moon" vs "moon", "bearish" vs "bear")
+    # count once.
+    _KEYWORD_SIDE = {
+        **dict.fromkeys(BULLISH_KEYWORDS, 1),
+        **dict.fromkeys(BEARISH_KEYWORDS, -1),
     }
-
-    def __init__(self) -> None:
-        self._http = httpx.AsyncClient(
-            headers=self._HEADERS,
-            timeout=15.0,
-            follow_redirects=True,
-        )
+    _KEYWORD_AUTOMATON = _keyword_automaton(_KEYWORD_SIDE)
 
     # ── Public JSON API ────────────────────────────────────────
 
@@ -157,9 +261,9 @@ class RedditClient:
             params["t"] = t
 
         try:
-            resp = await self._http.get(url, params=params)
+            resp = await _reddit_http().get(url, params=params)
             resp.raise_for_status()
-            data = resp.json()
+            data = orjson.loads(resp.content)
             children = data.get("data", {}).get("children", [])
             return [c["data"] for c in children if c.get("kind") == "t3"]
         except Exception as e:
@@ -169,24 +273,45 @@ class RedditClient:
     # ── Ticker / sentiment helpers ─────────────────────────────
 
     def _extract_tickers(self, text: str) -> list[str]:
-        matches = self.TICKER_PATTERN.findall(text)
-        seen: set[str] = set()
-        tickers = []
-        for match in matches:
-            ticker = match[0] or match[1]
-            if ticker not in self.COMMON_WORDS and ticker not in seen:
-                tickers.append(ticker)
-                seen.add(ticker)
-        return tickers
+        # dict.fromkeys de-duplicates while keeping first-seen order
+        return list(dict.fromkeys(self.TICKER_PATTERN.findall(text)))
+
+    # Scores memoized by text digest so crossposts and repeated titles scan
+    # once; keying on the digest keeps long selftext bodies out of memory
+    _SENTIMENT_MEMO_SIZE = 4096
+    _sentiment_memo: OrderedDict[bytes, float] = OrderedDict()
 
     def _analyze_sentiment(self, text: str) -> float:
-        text_lower = text.lower()
-        bullish_count = sum(1 for kw in self.BULLISH_KEYWORDS if kw in text_lower)
-        bearish_count = sum(1 for kw in self.BEARISH_KEYWORDS if kw in text_lower)
-        total = bullish_count + bearish_count
-        if total == 0:
+        memo = RedditClient._sentiment_memo
+        key = hashlib.blake2b(text.encode(), digest_size=16).digest()
+        score = memo.get(key)
+        if score is not None:
+            memo.move_to_end(key)
+            return score
+        score = self._sentiment_of(text)
+        if len(memo) >= self._SENTIMENT_MEMO_SIZE:
+            memo.popitem(last=False)
+        memo[key] = score
+        return score
+
+    @staticmethod
+    def _sentiment_of(text: str) -> float:
+        """Score text by its whole-word bullish/bearish keywords."""
+        # Distinct whole-word keywords found -> side; (bullish - bearish) / total
+        lowered = text.lower()
+        last = len(lowered) - 1
+        found: dict[str, int] = {}
+        for end, (kw, side) in RedditClient._KEYWORD_AUTOMATON.iter_long(lowered):
+            start = end - len(kw) + 1
+            # Skip hits inside longer words ("gain" in "again", "red" in "shared")
+            if start > 0 and lowered[start - 1].isalnum():
+                continue
+            if end < last and lowered[end + 1].isalnum():
+                continue
+            found[kw] = side
+        if not found:
             return 0.0
-        return (bullish_count - bearish_count) / total
+        return sum(found.values()) / len(found)
 
     # ── Core public methods ────────────────────────────────────
 
@@ -203,18 +328,18 @@ class RedditClient:
 
         posts = []
         for p in raw_posts:
-            text = f"{p.get('title', '')} {p.get('selftext', '')}"
-            tickers = self._extract_tickers(text)
+            title = p.get("title", "")
+            selftext = p.get("selftext", "") or ""
             posts.append(RedditPost(
-                title=p.get("title", ""),
+                title=title,
                 subreddit=subreddit_name,
                 score=p.get("score", 0),
                 num_comments=p.get("num_comments", 0),
-                created_utc=datetime.fromtimestamp(p.get("created_utc", 0), tz=UTC),
+                created_utc=p.get("created_utc", 0),
                 url=f"https://reddit.com{p.get('permalink', '')}",
                 is_self=p.get("is_self", False),
-                selftext=(p.get("selftext", "") or "")[:500],
-                tickers=tickers,
+                selftext=selftext[:500],
+                tickers=self._extract_tickers(f"{title} {selftext}"),
             ))
         return posts
 
@@ -223,44 +348,45 @@ class RedditClient:
         subreddit_name: str,
         limit: int = 50,
     ) -> SubredditSentiment | None:
-        """Analyze sentiment for a subreddit."""
-        posts = await self.fetch_subreddit_posts(subreddit_name, limit)
-        if not posts:
-            return None
-
-        total_score = sum(p.score for p in posts)
-        total_comments = sum(p.num_comments for p in posts)
+        """Analyze sentiment for a subreddit.
 
-        all_tickers: list[str] = []
-        for p in posts:
-            all_tickers.extend(p.tickers)
-        ticker_counts = Counter(all_tickers).most_common(10)
-
-        sentiments = []
-        for p in posts:
-            text = f"{p.title} {p.selftext}"
-            sentiments.append(self._analyze_sentiment(text))
+        Works on the raw JSON in a single pass rather than building
+        ``RedditPost`` objects, which only the detail endpoints need.
+        """
+        raw_posts = await self._fetch_subreddit_json(subreddit_name, limit=limit)
+        if not raw_posts:
+            return None
 
-        avg_sentiment = sum(sentiments) / len(sentiments) if sentiments else 0
-        bullish_count = sum(1 for s in sentiments if s > 0)
-        bullish_ratio = bullish_count / len(sentiments) if sentiments else 0.5
+        n = len(raw_posts)
+        scores = np.empty(n, dtype=np.int64)
+        comments = np.empty(n, dtype=np.int64)
+        sentiments = np.empty(n, dtype=np.float64)
+        ticker_counts: Counter[str] = Counter()
+        for i, p in enumerate(raw_posts):
+            text = f"{p.get('title', '')} {p.get('selftext', '') or ''}"
+            scores[i] = p.get("score", 0)
+            comments[i] = p.get("num_comments", 0)
+            sentiments[i] = self._analyze_sentiment(text)
+            ticker_counts.update(self._extract_tickers(text))
 
         return SubredditSentiment(
             subreddit=subreddit_name,
-            post_count=len(posts),
-            avg_score=total_score / len(posts),
-            avg_comments=total_comments / len(posts),
-            top_tickers=ticker_counts,
-            sentiment_score=avg_sentiment,
-            bullish_ratio=bullish_ratio,
+            post_count=n,
+            avg_score=float(scores.mean()),
+            avg_comments=float(comments.mean()),
+            top_tickers=ticker_counts.most_common(10),
+            sentiment_score=float(sentiments.mean()),
+            bullish_ratio=float((sentiments > 0).mean()),
         )
 
     async def get_all_sentiment(self) -> dict[str, SubredditSentiment]:
-        """Get sentiment from all configured subreddits (cached)."""
-        cached = _cache.get("all_sentiment")
-        if cached is not None:
-            return cached
+        """Get sentiment from all configured subreddits (cached).
+
+        Concurrent callers on a cold cache share one Reddit fan-out.
+        """
+        return await _cache.get_or_compute("all_sentiment", self._load_all_sentiment)
 
+    async def _load_all_sentiment(self) -> dict[str, SubredditSentiment]:
         tasks = [self.analyze_subreddit(sub) for sub in REDDIT_SUBREDDITS]
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
@@ -270,43 +396,51 @@ class RedditClient:
                 sentiment_data[sub] = result
             elif isinstance(result, Exception):
                 logger.warning("Error analyzing r/%s: %s", sub, result)
-
-        if sentiment_data:
-            _cache.set("all_sentiment", sentiment_data)
         return sentiment_data
 
-    async def get_trending_tickers(self, limit: int = 20) -> list[tuple[str, int]]:
-        """Get trending tickers across all subreddits."""
-        sentiment_data = await self.get_all_sentiment()
+    @staticmethod
+    def _trending(
+        sentiment_data: dict[str, SubredditSentiment], limit: int
+    ) -> list[tuple[str, int]]:
         all_tickers: Counter[str] = Counter()
         for data in sentiment_data.values():
             for ticker, count in data.top_tickers:
                 all_tickers[ticker] += count
         return all_tickers.most_common(limit)
 
+    async def get_trending_tickers(self, limit: int = 20) -> list[tuple[str, int]]:
+        """Get trending tickers across all subreddits."""
+        return self._trending(await self.get_all_sentiment(), limit)
+
     async def get_overall_sentiment(self) -> dict[str, Any]:
         """Get overall market sentiment summary."""
         sentiment_data = await self.get_all_sentiment()
         if not sentiment_data:
             return {}
 
-        total_posts = sum(d.post_count for d in sentiment_data.values())
+        # Columns: sentiment_score, bullish_ratio, post_count
+        vals = np.array(
+            [
+                (d.sentiment_score, d.bullish_ratio, d.post_count)
+                for d in sentiment_data.values()
+            ],
+            dtype=np.float64,
+        )
+        weights = vals[:, 2]
+        total_posts = int(weights.sum())
         if total_posts == 0:
             return {}
 
-        weighted_sentiment = sum(
-            d.sentiment_score * d.post_count for d in sentiment_data.values()
-        ) / total_posts
-
-        weighted_bullish = sum(
-            d.bullish_ratio * d.post_count for d in sentiment_data.values()
-        ) / total_posts
+        weighted_sentiment, weighted_bullish = np.average(
+            vals[:, :2], axis=0, weights=weights
+        )
 
-        trending = await self.get_trending_tickers(10)
+        # Reuse the snapshot above rather than going back through the cache
+        trending = self._trending(sentiment_data, 10)
 
         return {
-            "overall_sentiment": round(weighted_sentiment, 4),
-            "overall_bullish_ratio": round(weighted_bullish, 4),
+            "overall_sentiment": round(float(weighted_sentiment), 4),
+            "overall_bullish_ratio": round(float(weighted_bullish), 4),
             "total_posts_analyzed": total_posts,
             "subreddit_count": len(sentiment_data),
             "trending_tickers": trending,
@@ -316,7 +450,7 @@ class RedditClient:
     async def health_check(self) -> bool:
         """Check Reddit public API availability."""
         try:
-            resp = await self._http.get(
+            resp = await _reddit_http().get(
                 "https://www.reddit.com/r/stocks/hot.json",
                 params={"limit": 1, "raw_json": 1},
             )
@@ -4,10 +4,16 @@ from __future__ import annotations
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Literal
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal
 
 from src.config.settings import settings
 
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
+
 logger = logging.getLogger(__name__)
 
 Provider = Literal["local", "openai", "gemini"]
@@ -32,6 +38,24 @@ PROVIDER_INFO: dict[str, dict] = {
 }
 
 
+# Concurrent provider requests per embed_texts call (rate-limit headroom)
+_MAX_CONCURRENT_BATCHES = 5
+
+
+def _embed_batched(
+    texts: list[str],
+    batch_size: int,
+    embed_batch: Callable[[list[str]], list[list[float]]],
+) -> list[list[float]]:
+    """Split ``texts`` into batches and embed them concurrently, in order."""
+    batches = [texts[i : i + batch_size] for i in range(0, len(texts), batch_size)]
+    if len(batches) == 1:
+        return embed_batch(batches[0])
+    workers = min(len(batches), _MAX_CONCURRENT_BATCHES)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return [vec for batch in pool.map(embed_batch, batches) for vec in batch]
+
+
 # ── Abstract base ────────────────────────────────────────────
 
 class _BaseEmbedder(ABC):
@@ -44,22 +68,63 @@ class _BaseEmbedder(ABC):
 
 # ── Local (sentence-transformers) ────────────────────────────
 
+def _load_int8_onnx(name: str) -> SentenceTransformer:
+    """Load ``name`` as a dynamically quantized INT8 ONNX model.
+
+    The quantized export is built once and kept under ``model_cache_dir``;
+    later loads read it straight from disk. Needs the ``onnx`` extra
+    (optimum + onnxruntime).
+    """
+    from sentence_transformers import (
+        SentenceTransformer,
+        export_dynamic_quantized_onnx_model,
+    )
+
+    cache_dir = Path(settings.model_cache_dir).expanduser()
+    model_dir = cache_dir / f"{name.replace('/', '__')}-onnx"
+    quantized = sorted(model_dir.glob("onnx/*int8*.onnx"))
+    if not quantized:
+        logger.info("Exporting INT8 ONNX embedding model to %s", model_dir)
+        model = SentenceTransformer(name, backend="onnx")
+        model.save_pretrained(str(model_dir))
+        export_dynamic_quantized_onnx_model(model, "avx2", str(model_dir))
+        quantized = sorted(model_dir.glob("onnx/*int8*.onnx"))
+
+    file_name = quantized[0].relative_to(model_dir).as_posix()
+    return SentenceTransformer(
+        str(model_dir), backend="onnx", model_kwargs={"file_name": file_name}
+    )
+
+
 class _LocalEmbedder(_BaseEmbedder):
     _model = None
 
     def __init__(self, model_name: str | None = None) -> None:
         name = model_name or settings.local_embedding_model
-        if _LocalEmbedder._model is None or _LocalEmbedder._model_name != name:
-            from sentence_transformers import SentenceTransformer
-            logger.info("Loading local embedding model: %s", name)
-            _LocalEmbedder._model = SentenceTransformer(name)
-            _LocalEmbedder._model_name = name
+        backend = settings.local_embedding_backend
+        key = (name, backend)
+        if _LocalEmbedder._model is None or _LocalEmbedder._model_key != key:
+            logger.info("Loading local embedding model: %s (%s)", name, backend)
+            if backend == "onnx-int8":
+                _LocalEmbedder._model = _load_int8_onnx(name)
+            else:
+                from sentence_transformers import SentenceTransformer
+                _LocalEmbedder._model = SentenceTransformer(name)
+            _LocalEmbedder._model_key = key
 
     def embed_texts(self, texts: list[str]) -> list[list[float]]:
         if not texts:
             return []
-        embeddings = _LocalEmbedder._model.encode(texts, show_progress_bar=False)
-        return [e.tolist() for e in embeddings]
+        # One batched call; the collection is cosine-space, so unit-norm
+        # vectors give identical rankings
+        embeddings = _LocalEmbedder._model.encode(
+            texts,
+            batch_size=64,
+            show_progress_bar=False,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+        )
+        return embeddings.tolist()
 
 
 # ── OpenAI ───────────────────────────────────────────────────
@@ -76,13 +141,11 @@ class _OpenAIEmbedder(_BaseEmbedder):
     def embed_texts(self, texts: list[str]) -> list[list[float]]:
         if not texts:
             return []
-        batch_size = 512
-        all_embeddings: list[list[float]] = []
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i : i + batch_size]
-            response = self._client.embeddings.create(input=batch, model=self.model)
-            all_embeddings.extend([item.embedding for item in response.data])
-        return all_embeddings
+        return _embed_batched(texts, 512, self._embed_batch)
+
+    def _embed_batch(self, batch: list[str]) -> list[list[float]]:
+        response = self._client.embeddings.create(input=batch, model=self.model)
+        return [item.embedding for item in response.data]
 
 
 # ── Gemini ───────────────────────────────────────────────────
@@ -99,16 +162,14 @@ class _GeminiEmbedder(_BaseEmbedder):
     def embed_texts(self, texts: list[str]) -> list[list[float]]:
         if not texts:
             return []
-        batch_size = 100  # Gemini batch limit
-        all_embeddings: list[list[float]] = []
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i : i + batch_size]
-            result = self._client.models.embed_content(
-                model=self.model,
-                contents=batch,
-            )
-            all_embeddings.extend([e.values for e in result.embeddings])
-        return all_embeddings
+        return _embed_batched(texts, 100, self._embed_batch)  # Gemini batch limit
+
+    def _embed_batch(self, batch: list[str]) -> list[list[float]]:
+        result = self._client.models.embed_content(
+            model=self.model,
+            contents=batch,
+        )
+        return [e.values for e in result.embeddings]
 
 
 # ── Factory ──────────────────────────────────────────────────
@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass
 
-from pypdf import PdfReader
+import pypdfium2 as pdfium
 
 from src.config.settings import settings
 
@@ -33,24 +33,29 @@ class PDFProcessor:
 
         Returns (full_text, page_count).
         """
-        import io
-
-        reader = PdfReader(io.BytesIO(file_bytes))
-        pages = []
-        for page in reader.pages:
-            text = page.extract_text() or ""
-            pages.append(text)
-        return "\n\n".join(pages), len(reader.pages)
+        pages = self.extract_pages(file_bytes)
+        return "\n\n".join(text for _, text in pages), len(pages)
 
     def extract_pages(self, file_bytes: bytes) -> list[tuple[int, str]]:
-        """Extract text per page. Returns list of (page_number, text)."""
-        import io
+        """Extract text per page. Returns list of (page_number, text).
 
-        reader = PdfReader(io.BytesIO(file_bytes))
-        return [
-            (i + 1, page.extract_text() or "")
-            for i, page in enumerate(reader.pages)
-        ]
+        Uses PDFium, whose text is CRLF-delimited; line endings are
+        normalised so chunk_text's separators still match.
+        """
+        pdf = pdfium.PdfDocument(file_bytes)
+        try:
+            pages = []
+            for i, page in enumerate(pdf):
+                textpage = page.get_textpage()
+                try:
+                    text = textpage.get_text_range()
+                finally:
+                    textpage.close()
+                    page.close()
+                pages.append((i + 1, text.replace("\r\n", "\n")))
+            return pages
+        finally:
+            pdf.close()
 
     def chunk_text(
         self,
@@ -67,18 +72,20 @@ class PDFProcessor:
         start = 0
         idx = 0
 
-        while start < len(text):
+        n = len(text)
+        while start < n:
             end = start + self.chunk_size
-            chunk_text = text[start:end]
 
-            # Try to break at a sentence or paragraph boundary
-            if end < len(text):
+            # Try to break at a sentence or paragraph boundary in the back
+            # half of the window; search by index and slice only once
+            if end < n:
+                floor = start + self.chunk_size // 2 + 1
                 for sep in ("\n\n", "\n", ". ", " "):
-                    last = chunk_text.rfind(sep)
-                    if last > self.chunk_size // 2:
-                        chunk_text = chunk_text[: last + len(sep)]
-                        end = start + len(chunk_text)
+                    cut = text.rfind(sep, floor, end)
+                    if cut != -1:
+                        end = cut + len(sep)
                         break
+            chunk_text = text[start:end]
 
             chunks.append(
                 TextChunk(
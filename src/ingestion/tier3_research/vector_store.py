@@ -7,6 +7,8 @@ import sys
 from dataclasses import dataclass
 from typing import Any
 
+import numpy as np
+
 from src.config.settings import settings
 
 logger = logging.getLogger(__name__)
@@ -139,22 +141,21 @@ class VectorStore:
             include=["documents", "metadatas", "distances"],
         )
 
-        hits: list[SearchResult] = []
-        if results["documents"] and results["documents"][0]:
-            for doc, meta, dist in zip(
-                results["documents"][0],
-                results["metadatas"][0],
-                results["distances"][0],
-            ):
-                hits.append(
-                    SearchResult(
-                        text=doc,
-                        document_id=meta.get("document_id", ""),
-                        score=1.0 - dist,  # cosine distance → similarity
-                        metadata=meta,
-                    )
-                )
-        return hits
+        docs = results["documents"][0] if results["documents"] else []
+        if not docs:
+            return []
+
+        # Cosine distance → similarity, in one vectorized step
+        scores = (1.0 - np.asarray(results["distances"][0], dtype=np.float64)).tolist()
+        return [
+            SearchResult(
+                text=doc,
+                document_id=meta.get("document_id", ""),
+                score=score,
+                metadata=meta,
+            )
+            for doc, meta, score in zip(docs, results["metadatas"][0], scores)
+        ]
 
     def delete_document(self, document_id: str) -> None:
         """Remove all chunks for a document."""
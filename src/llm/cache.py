@@ -0,0 +1,77 @@
+"""Exact-match response cache for LLM calls."""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Protocol
+
+import orjson
+
+from src.config.settings import settings
+
+
+class CacheBackend(Protocol):
+    """Shared cache tier; ``CacheManager`` (Redis) satisfies this."""
+
+    async def get(self, key: str) -> Any | None: ...
+
+    async def set(self, key: str, value: Any, ttl: int = 3600) -> bool: ...
+
+
+class LLMCache:
+    """In-process LRU in front of an optional shared backend.
+
+    Keys hash the full request (provider, model, system prompt, prompt),
+    so only byte-identical requests hit. Report prompts embed live market
+    data, which is why there is no fuzzy / semantic tier: a near-match
+    prompt with different numbers must not reuse an old answer.
+    """
+
+    MAX_ENTRIES = 256
+
+    def __init__(
+        self,
+        ttl: int | None = None,
+        shared: CacheBackend | None = None,
+    ) -> None:
+        self._ttl = ttl if ttl is not None else settings.cache_ttl_llm
+        self._shared = shared
+        self._store: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+    @staticmethod
+    def cache_key(provider: str, model: str, system_prompt: str, prompt: str) -> str:
+        digest = hashlib.sha256(
+            orjson.dumps([provider, model, system_prompt, prompt])
+        ).hexdigest()
+        return f"llm:{digest}"
+
+    async def get(self, key: str) -> str | None:
+        entry = self._store.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if time.monotonic() <= expires_at:
+                self._store.move_to_end(key)
+                return value
+            self._store.pop(key, None)
+
+        if self._shared is None:
+            return None
+        value = await self._shared.get(key)
+        if isinstance(value, str):
+            self._set_local(key, value)
+            return value
+        return None
+
+    async def set(self, key: str, value: str) -> None:
+        self._set_local(key, value)
+        if self._shared is not None:
+            await self._shared.set(key, value, ttl=self._ttl)
+
+    def _set_local(self, key: str, value: str) -> None:
+        if key in self._store:
+            self._store.move_to_end(key)
+        elif len(self._store) >= self.MAX_ENTRIES:
+            self._store.popitem(last=False)
+        self._store[key] = (time.monotonic() + self._ttl, value)
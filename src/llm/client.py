@@ -2,17 +2,43 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import random
+import time
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from typing import Literal
 
+import httpx
+import orjson
+
 from src.config.settings import settings
+from src.llm.cache import LLMCache
 
 logger = logging.getLogger(__name__)
 
 LLMProvider = Literal["openai", "gemini", "anthropic", "ollama"]
+LLMTier = Literal["default", "light"]
+
+# Ollama retries for overload (503 while a model loads) and server errors;
+# the OpenAI and Anthropic SDKs already retry these themselves
+_OLLAMA_MAX_ATTEMPTS = 3
+_OLLAMA_MAX_BACKOFF = 10.0
+_OLLAMA_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Consecutive failures before a provider's circuit opens, and how long it
+# stays open (calls fail fast instead of waiting on timeouts)
+_BREAKER_THRESHOLD = 5
+_BREAKER_COOLDOWN = 60.0
+
 
-# Provider metadata for frontend consumption
+class LLMUnavailableError(RuntimeError):
+    """Raised without calling the provider while its circuit is open."""
+
+
+# Provider metadata for frontend consumption. ``light_model`` serves the
+# "light" tier (short rewrites); None means the selected model is used.
 LLM_PROVIDER_INFO: dict[str, dict] = {
     "openai": {
         "label": "OpenAI",
@@ -21,6 +47,7 @@ LLM_PROVIDER_INFO: dict[str, dict] = {
         "env_var": "OPENAI_API_KEY",
         "models": ["gpt-4o", "gpt-4o-mini"],
         "default_model": "gpt-4o-mini",
+        "light_model": "gpt-4o-mini",
     },
     "gemini": {
         "label": "Google Gemini",
@@ -29,14 +56,16 @@ LLM_PROVIDER_INFO: dict[str, dict] = {
         "env_var": "GEMINI_API_KEY",
         "models": ["gemini-2.0-flash", "gemini-1.5-pro"],
         "default_model": "gemini-2.0-flash",
+        "light_model": "gemini-2.0-flash",
     },
     "anthropic": {
         "label": "Anthropic",
         "type": "closed",
         "needs_key": True,
         "env_var": "ANTHROPIC_API_KEY",
-        "models": ["claude-sonnet-4-20250514"],
+        "models": ["claude-sonnet-4-20250514", "claude-3-5-haiku-20241022"],
         "default_model": "claude-sonnet-4-20250514",
+        "light_model": "claude-3-5-haiku-20241022",
     },
     "ollama": {
         "label": "Ollama (Local)",
@@ -45,6 +74,7 @@ LLM_PROVIDER_INFO: dict[str, dict] = {
         "env_var": None,
         "models": ["llama3.2", "mistral", "gemma2"],
         "default_model": "llama3.2",
+        "light_model": None,
     },
 }
 
@@ -54,7 +84,22 @@ LLM_PROVIDER_INFO: dict[str, dict] = {
 
 class _BaseLLMClient(ABC):
     @abstractmethod
-    async def generate(self, prompt: str, system_prompt: str = "") -> str: ...
+    async def generate(
+        self,
+        prompt: str,
+        system_prompt: str = "",
+        json_mode: bool = False,
+        max_tokens: int = 2048,
+    ) -> str:
+        """Return the completion text.
+
+        With ``json_mode`` the provider is asked to emit a single JSON
+        object; the prompt must still describe the expected shape.
+        ``max_tokens`` caps the output; size it to the expected length.
+        """
+
+    async def aclose(self) -> None:
+        """Release the provider SDK's connection pool, if it has one."""
 
 
 # ── OpenAI ───────────────────────────────────────────────────
@@ -70,7 +115,13 @@ class _OpenAILLMClient(_BaseLLMClient):
         self._client = AsyncOpenAI(api_key=key.get_secret_value())
         self.model = model or LLM_PROVIDER_INFO["openai"]["default_model"]
 
-    async def generate(self, prompt: str, system_prompt: str = "") -> str:
+    async def generate(
+        self,
+        prompt: str,
+        system_prompt: str = "",
+        json_mode: bool = False,
+        max_tokens: int = 2048,
+    ) -> str:
         messages: list[dict] = []
         if system_prompt:
             messages.append({"role": "system", "content": system_prompt})
@@ -79,10 +130,14 @@ class _OpenAILLMClient(_BaseLLMClient):
             model=self.model,
             messages=messages,
             temperature=0.7,
-            max_tokens=2048,
+            max_tokens=max_tokens,
+            **({"response_format": {"type": "json_object"}} if json_mode else {}),
         )
         return response.choices[0].message.content or ""
 
+    async def aclose(self) -> None:
+        await self._client.close()
+
 
 # ── Gemini ───────────────────────────────────────────────────
 
@@ -97,14 +152,22 @@ class _GeminiLLMClient(_BaseLLMClient):
         self._client = genai.Client(api_key=key.get_secret_value())
         self.model = model or LLM_PROVIDER_INFO["gemini"]["default_model"]
 
-    async def generate(self, prompt: str, system_prompt: str = "") -> str:
-        import asyncio
-
+    async def generate(
+        self,
+        prompt: str,
+        system_prompt: str = "",
+        json_mode: bool = False,
+        max_tokens: int = 2048,
+    ) -> str:
         full_prompt = f"{system_prompt}\n\n{prompt}" if system_prompt else prompt
+        config: dict = {"max_output_tokens": max_tokens}
+        if json_mode:
+            config["response_mime_type"] = "application/json"
         response = await asyncio.to_thread(
             self._client.models.generate_content,
             model=self.model,
             contents=full_prompt,
+            config=config,
         )
         return response.text or ""
 
@@ -122,47 +185,126 @@ class _AnthropicLLMClient(_BaseLLMClient):
         self._client = AsyncAnthropic(api_key=key.get_secret_value())
         self.model = model or LLM_PROVIDER_INFO["anthropic"]["default_model"]
 
-    async def generate(self, prompt: str, system_prompt: str = "") -> str:
+    async def generate(
+        self,
+        prompt: str,
+        system_prompt: str = "",
+        json_mode: bool = False,
+        max_tokens: int = 2048,
+    ) -> str:
+        messages: list[dict] = [{"role": "user", "content": prompt}]
+        if json_mode:
+            # No JSON response format here; prefilling the opening brace
+            # keeps the model from wrapping the object in prose
+            messages.append({"role": "assistant", "content": "{"})
         kwargs: dict = {
             "model": self.model,
-            "max_tokens": 2048,
-            "messages": [{"role": "user", "content": prompt}],
+            "max_tokens": max_tokens,
+            "messages": messages,
         }
         if system_prompt:
-            kwargs["system"] = system_prompt
+            # Mark the shared system prompt as a cacheable prefix; Anthropic
+            # only caches prefixes past its minimum length and ignores the
+            # marker otherwise
+            kwargs["system"] = [
+                {
+                    "type": "text",
+                    "text": system_prompt,
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ]
         response = await self._client.messages.create(**kwargs)
-        return response.content[0].text
+        text = response.content[0].text
+        return "{" + text if json_mode else text
+
+    async def aclose(self) -> None:
+        await self._client.close()
 
 
 # ── Ollama ───────────────────────────────────────────────────
 
 
+_ollama_http: httpx.AsyncClient | None = None
+_ollama_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _ollama_client() -> httpx.AsyncClient:
+    """Return the shared Ollama HTTP client, creating it on first use.
+
+    LLMClient is built per report, so the pool lives at module level to
+    keep connections across reports. A new client is made if the caller
+    runs on a different event loop.
+    """
+    global _ollama_http, _ollama_loop
+    loop = asyncio.get_running_loop()
+    if _ollama_http is None or _ollama_http.is_closed or _ollama_loop is not loop:
+        _ollama_http = httpx.AsyncClient(
+            base_url=settings.ollama_base_url.rstrip("/"),
+            timeout=httpx.Timeout(120.0, connect=10.0),
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+        )
+        _ollama_loop = loop
+    return _ollama_http
+
+
 class _OllamaLLMClient(_BaseLLMClient):
     def __init__(self, model: str | None = None) -> None:
-        self._base_url = settings.ollama_base_url.rstrip("/")
         self.model = model or LLM_PROVIDER_INFO["ollama"]["default_model"]
 
-    async def generate(self, prompt: str, system_prompt: str = "") -> str:
-        import httpx
-
+    async def generate(
+        self,
+        prompt: str,
+        system_prompt: str = "",
+        json_mode: bool = False,
+        max_tokens: int = 2048,
+    ) -> str:
         payload: dict = {
             "model": self.model,
             "prompt": prompt,
             "stream": False,
+            "options": {"num_predict": max_tokens},
         }
         if system_prompt:
             payload["system"] = system_prompt
-
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            resp = await client.post(
-                f"{self._base_url}/api/generate", json=payload
+        if json_mode:
+            payload["format"] = "json"
+
+        body = orjson.dumps(payload)
+        for attempt in range(_OLLAMA_MAX_ATTEMPTS):
+            resp = await _ollama_client().post(
+                "/api/generate",
+                content=body,
+                headers={"Content-Type": "application/json"},
             )
-            resp.raise_for_status()
-            return resp.json().get("response", "")
+            if (
+                resp.status_code not in _OLLAMA_RETRY_STATUSES
+                or attempt == _OLLAMA_MAX_ATTEMPTS - 1
+            ):
+                break
+            delay = min(2**attempt + random.random() * 0.5, _OLLAMA_MAX_BACKOFF)
+            logger.warning(
+                "Ollama returned %s, retrying in %.1fs", resp.status_code, delay
+            )
+            await asyncio.sleep(delay)
+        resp.raise_for_status()
+        return orjson.loads(resp.content).get("response", "")
 
 
 # ── Factory ──────────────────────────────────────────────────
 
+_response_cache: LLMCache | None = None
+
+
+def _get_response_cache() -> LLMCache:
+    """Process-wide response cache, backed by Redis via CacheManager."""
+    global _response_cache
+    if _response_cache is None:
+        from src.ingestion.base import CacheManager
+
+        _response_cache = LLMCache(shared=CacheManager())
+    return _response_cache
+
+
 _PROVIDERS: dict[str, type[_BaseLLMClient]] = {
     "openai": _OpenAILLMClient,
     "gemini": _GeminiLLMClient,
@@ -170,19 +312,129 @@ _PROVIDERS: dict[str, type[_BaseLLMClient]] = {
     "ollama": _OllamaLLMClient,
 }
 
+# (provider, model) -> (event loop the client was built on, client)
+_provider_clients: dict[
+    tuple[str, str], tuple[asyncio.AbstractEventLoop | None, _BaseLLMClient]
+] = {}
+
+
+def _provider_client(provider: str, model: str) -> _BaseLLMClient:
+    """Return the shared SDK wrapper for (provider, model), building it once.
+
+    LLMClient is built per report; sharing the wrapper keeps the SDK's
+    connection pool (and TLS sessions) across reports. As with the Ollama
+    client, a new one is made when the caller runs on a different loop.
+    """
+    try:
+        loop: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    key = (provider, model)
+    entry = _provider_clients.get(key)
+    if entry is None or (entry[0] is not None and entry[0] is not loop):
+        entry = (loop, _PROVIDERS[provider](model=model))
+    elif entry[0] is None:
+        # Built outside a loop (SDK pools open lazily), so adopt this one
+        entry = (loop, entry[1])
+    _provider_clients[key] = entry
+    return entry[1]
+
+
+@dataclass(slots=True)
+class _Breaker:
+    """Per-provider failure count and the time its circuit reopens."""
+
+    failures: int = 0
+    open_until: float = 0.0
+
+
+_breakers: dict[str, _Breaker] = {}
+
+
+async def close() -> None:
+    """Close the shared Ollama HTTP client and cached provider SDK clients."""
+    global _ollama_http, _ollama_loop
+    if _ollama_http is not None:
+        await _ollama_http.aclose()
+        _ollama_http = None
+        _ollama_loop = None
+    clients = [client for _, client in _provider_clients.values()]
+    _provider_clients.clear()
+    for client in clients:
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.debug("Error closing LLM provider client: %s", e)
+
 
 class LLMClient(_BaseLLMClient):
-    """Unified async LLM client. Provider chosen by explicit arg."""
+    """Unified async LLM client. Provider chosen by explicit arg.
+
+    Calls go to the selected model unless they ask for the ``light`` tier,
+    which uses the provider's cheaper ``light_model`` for short rewrites.
+    After ``_BREAKER_THRESHOLD`` consecutive failures a provider is skipped
+    for ``_BREAKER_COOLDOWN`` seconds: calls raise ``LLMUnavailableError``
+    at once, so enhancers fall back to rule-based text without waiting.
+    """
 
     def __init__(
         self, provider: LLMProvider, model: str | None = None
     ) -> None:
-        cls = _PROVIDERS.get(provider)
-        if cls is None:
+        if provider not in _PROVIDERS:
             raise ValueError(f"Unknown LLM provider: {provider}")
-        self._inner = cls(model=model)
         self.provider = provider
         self.model = model or LLM_PROVIDER_INFO[provider]["default_model"]
-
-    async def generate(self, prompt: str, system_prompt: str = "") -> str:
-        return await self._inner.generate(prompt, system_prompt)
+        self.light_model = LLM_PROVIDER_INFO[provider]["light_model"] or self.model
+        # Build (or reuse) the default client now so a missing API key
+        # fails at construction rather than on the first call
+        _provider_client(provider, self.model)
+
+    def _client_for(self, tier: LLMTier) -> tuple[_BaseLLMClient, str]:
+        model = self.model if tier == "default" else self.light_model
+        return _provider_client(self.provider, model), model
+
+    async def generate(
+        self,
+        prompt: str,
+        system_prompt: str = "",
+        json_mode: bool = False,
+        max_tokens: int = 2048,
+        tier: LLMTier = "default",
+    ) -> str:
+        """Generate a response, reusing a cached one for identical requests."""
+        inner, model = self._client_for(tier)
+        cache = _get_response_cache()
+        key = cache.cache_key(
+            f"{self.provider}+json" if json_mode else self.provider,
+            model,
+            system_prompt,
+            prompt,
+        )
+        cached = await cache.get(key)
+        if cached is not None:
+            return cached
+
+        breaker = _breakers.setdefault(self.provider, _Breaker())
+        if time.monotonic() < breaker.open_until:
+            raise LLMUnavailableError(
+                f"{self.provider} skipped after repeated failures"
+            )
+        try:
+            result = await inner.generate(prompt, system_prompt, json_mode, max_tokens)
+        except Exception:
+            breaker.failures += 1
+            if breaker.failures >= _BREAKER_THRESHOLD:
+                breaker.open_until = time.monotonic() + _BREAKER_COOLDOWN
+                # One more failure after the cooldown reopens the circuit
+                breaker.failures = _BREAKER_THRESHOLD - 1
+                logger.warning(
+                    "LLM provider %s failing, skipping it for %.0fs",
+                    self.provider,
+                    _BREAKER_COOLDOWN,
+                )
+            raise
+        breaker.failures = 0
+
+        if result.strip():
+            await cache.set(key, result)
+        return result
@@ -2,16 +2,17 @@
 
 from __future__ import annotations
 
+import json
 import logging
 
+import orjson
+
 from src.llm.client import LLMClient
 from src.llm.prompts import (
     SYSTEM_PROMPT,
     executive_summary_prompt,
-    pulse_narrative_prompt,
-    pulse_takeaways_prompt,
-    macro_outlook_prompt,
-    macro_themes_prompt,
+    pulse_combined_prompt,
+    macro_combined_prompt,
     sentiment_narrative_prompt,
     forward_lesson_prompt,
 )
@@ -25,11 +26,44 @@ from src.reports.models import (
 logger = logging.getLogger(__name__)
 
 
+def _text_and_items(
+    raw: str, text_key: str, list_key: str
+) -> tuple[str | None, list[str] | None]:
+    """Pull a prose field and a list field out of a JSON LLM response.
+
+    JSON-mode responses are parsed directly; otherwise the first object
+    is pulled out of any surrounding text (code fences, a preamble). Either
+    field comes back as None when missing or malformed, so the caller
+    keeps the rule-based value for just that field.
+    """
+    try:
+        data = orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        start = raw.find("{")
+        if start < 0:
+            raise ValueError("no JSON object in LLM response") from None
+        data, _ = json.JSONDecoder().raw_decode(raw, start)
+    if not isinstance(data, dict):
+        raise ValueError("LLM response is not a JSON object")
+
+    text = data.get(text_key)
+    text = text.strip() if isinstance(text, str) and text.strip() else None
+    items = data.get(list_key)
+    if isinstance(items, list):
+        items = [str(i).strip() for i in items if str(i).strip()] or None
+    else:
+        items = None
+    return text, items
+
+
 class SectionEnhancer:
     """Enhances rule-based report sections with LLM-generated text.
 
     Every enhancement is wrapped in try/except — on failure the original
-    rule-based content is preserved unchanged.
+    rule-based content is preserved unchanged. Sections with both prose
+    and bullet fields (pulse, macro) get them from a single JSON-mode call,
+    so the shared market context is sent once. Short outputs pass a
+    ``max_tokens`` budget sized to their length.
     """
 
     def __init__(self, client: LLMClient) -> None:
@@ -45,44 +79,27 @@ class SectionEnhancer:
     ) -> PulseSection:
         updates: dict = {}
 
-        # Enhance big_narrative
         try:
             divergence_descs = [d.description for d in pulse.divergences]
-            sentiment_score = (
-                pulse.sentiment.overall_score if pulse.sentiment else None
-            )
-            prompt = pulse_narrative_prompt(
+            sentiment = pulse.sentiment.overall_score if pulse.sentiment else None
+            prompt = pulse_combined_prompt(
                 regime=pulse.regime.regime,
                 confidence=pulse.regime.confidence,
                 signals=pulse.regime.signals,
-                sentiment_score=sentiment_score,
+                existing_takeaways=pulse.key_takeaways,
+                sentiment_score=sentiment,
                 divergences=divergence_descs or None,
                 research_context=research_context,
                 custom_prompt=custom_prompt,
             )
-            narrative = await self._client.generate(prompt, SYSTEM_PROMPT)
-            if narrative.strip():
-                updates["big_narrative"] = narrative.strip()
-        except Exception as e:
-            logger.warning("LLM pulse narrative failed, keeping rule-based: %s", e)
-
-        # Enhance key_takeaways
-        try:
-            prompt = pulse_takeaways_prompt(
-                regime=pulse.regime.regime,
-                big_narrative=updates.get("big_narrative", pulse.big_narrative),
-                existing_takeaways=pulse.key_takeaways,
-            )
-            raw = await self._client.generate(prompt, SYSTEM_PROMPT)
-            lines = [
-                line.lstrip("- ").strip()
-                for line in raw.strip().splitlines()
-                if line.strip().startswith("-")
-            ]
-            if lines:
-                updates["key_takeaways"] = lines
+            raw = await self._client.generate(prompt, SYSTEM_PROMPT, json_mode=True)
+            narrative, takeaways = _text_and_items(raw, "narrative", "takeaways")
+            if narrative:
+                updates["big_narrative"] = narrative
+            if takeaways:
+                updates["key_takeaways"] = takeaways
         except Exception as e:
-            logger.warning("LLM pulse takeaways failed, keeping rule-based: %s", e)
+            logger.warning("LLM pulse enhancement failed, keeping rule-based: %s", e)
 
         return pulse.model_copy(update=updates) if updates else pulse
 
@@ -96,38 +113,26 @@ class SectionEnhancer:
     ) -> MacroSection:
         updates: dict = {}
 
-        # Enhance global_outlook
         try:
-            prompt = macro_outlook_prompt(
+            prompt = macro_combined_prompt(
                 us_headline=macro.us.headline if macro.us else None,
                 eu_headline=macro.eu.headline if macro.eu else None,
                 asia_headline=macro.asia.headline if macro.asia else None,
                 existing_outlook=macro.global_outlook,
+                existing_themes=macro.themes,
                 research_context=research_context,
                 custom_prompt=custom_prompt,
             )
-            outlook = await self._client.generate(prompt, SYSTEM_PROMPT)
-            if outlook.strip():
-                updates["global_outlook"] = outlook.strip()
-        except Exception as e:
-            logger.warning("LLM macro outlook failed, keeping rule-based: %s", e)
-
-        # Enhance themes
-        try:
-            prompt = macro_themes_prompt(
-                existing_themes=macro.themes,
-                outlook=updates.get("global_outlook", macro.global_outlook),
+            raw = await self._client.generate(
+                prompt, SYSTEM_PROMPT, json_mode=True, max_tokens=768
             )
-            raw = await self._client.generate(prompt, SYSTEM_PROMPT)
-            lines = [
-                line.lstrip("- ").strip()
-                for line in raw.strip().splitlines()
-                if line.strip().startswith("-")
-            ]
-            if lines:
-                updates["themes"] = lines
+            outlook, themes = _text_and_items(raw, "outlook", "themes")
+            if outlook:
+                updates["global_outlook"] = outlook
+            if themes:
+                updates["themes"] = themes
         except Exception as e:
-            logger.warning("LLM macro themes failed, keeping rule-based: %s", e)
+            logger.warning("LLM macro enhancement failed, keeping rule-based: %s", e)
 
         return macro.model_copy(update=updates) if updates else macro
 
@@ -187,7 +192,9 @@ class SectionEnhancer:
                 research_context=research_context,
                 custom_prompt=custom_prompt,
             )
-            lesson = await self._client.generate(prompt, SYSTEM_PROMPT)
+            lesson = await self._client.generate(
+                prompt, SYSTEM_PROMPT, max_tokens=300, tier="light"
+            )
             if lesson.strip():
                 updates["lesson_of_the_day"] = lesson.strip()
         except Exception as e:
@@ -212,7 +219,9 @@ class SectionEnhancer:
                 macro_outlook=macro_outlook,
                 section_headlines=section_headlines,
             )
-            result = await self._client.generate(prompt, SYSTEM_PROMPT)
+            result = await self._client.generate(
+                prompt, SYSTEM_PROMPT, max_tokens=300
+            )
             if result.strip():
                 return result.strip()
         except Exception as e:
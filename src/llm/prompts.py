@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 SYSTEM_PROMPT = (
     "You are an institutional-grade market analyst writing a self-contained "
     "professional daily brief for a hedge fund. Be concise, data-driven, and "
@@ -25,19 +27,17 @@ _RESEARCH_INSTRUCTION = (
 )
 
 
-def _format_research_context(chunks: list) -> str:
+@lru_cache(maxsize=32)
+def _format_research_context(entries: tuple[tuple[str, object, str], ...]) -> str:
     """Format research chunks into a prompt block.
 
-    Accepts a list of ResearchChunk-like objects (anything with .text,
-    .source, and .page attributes).
+    Takes ``(source, page, text preview)`` tuples so the result can be
+    memoized — every section of a report shares the same research set.
     """
-    if not chunks:
-        return ""
     lines = ["RESEARCH CONTEXT:"]
-    for i, chunk in enumerate(chunks, 1):
-        page_str = f", p.{chunk.page}" if chunk.page else ""
-        text_preview = chunk.text[:500]
-        lines.append(f"[{i}] ({chunk.source}{page_str}): {text_preview}")
+    for i, (source, page, text_preview) in enumerate(entries, 1):
+        page_str = f", p.{page}" if page else ""
+        lines.append(f"[{i}] ({source}{page_str}): {text_preview}")
     return "\n".join(lines)
 
 
@@ -51,6 +51,21 @@ def _format_custom_prompt(custom_prompt: str | None) -> str:
     )
 
 
+def _format_extra(research_context: list | None, custom_prompt: str | None) -> str:
+    """Research and custom-focus blocks appended to a section prompt.
+
+    Accepts a list of ResearchChunk-like objects (anything with .text,
+    .source, and .page attributes).
+    """
+    extra = ""
+    if research_context:
+        entries = tuple((c.source, c.page, c.text[:500]) for c in research_context)
+        extra = (
+            f"\n\n{_format_research_context(entries)}\n\n{_RESEARCH_INSTRUCTION}"
+        )
+    return extra + _format_custom_prompt(custom_prompt)
+
+
 def executive_summary_prompt(
     regime: str,
     top_asset_move: str,
@@ -76,15 +91,26 @@ def executive_summary_prompt(
     )
 
 
-def pulse_narrative_prompt(
+def _json_instruction(text_key: str, list_key: str, count: int) -> str:
+    """Output contract shared by the combined (text + bullets) prompts."""
+    return (
+        f"Respond with valid JSON only, no prose or code fences, shaped as "
+        f'{{"{text_key}": str, "{list_key}": [str, ...]}} '
+        f"with exactly {count} items in \"{list_key}\"."
+    )
+
+
+def pulse_combined_prompt(
     regime: str,
     confidence: float,
     signals: list[str],
+    existing_takeaways: list[str],
     sentiment_score: float | None = None,
     divergences: list[str] | None = None,
     research_context: list | None = None,
     custom_prompt: str | None = None,
 ) -> str:
+    """Prompt for the pulse narrative and key takeaways in one call."""
     signals_text = "\n".join(f"- {s}" for s in signals)
     parts = [
         f"Market regime: {regime} (confidence: {confidence:.0%})",
@@ -96,45 +122,36 @@ def pulse_narrative_prompt(
         parts.append(
             "Divergences:\n" + "\n".join(f"- {d}" for d in divergences)
         )
-    data_block = "\n\n".join(parts)
-    research_block = _format_research_context(research_context or [])
-    extra = f"\n\n{research_block}\n\n{_RESEARCH_INSTRUCTION}" if research_block else ""
-    extra += _format_custom_prompt(custom_prompt)
-    return (
-        f"Given the following market data, write a compelling 2-3 paragraph "
-        f"narrative (the 'big picture') for today's market pulse. "
-        f"Write as if this is the opening section of a professional daily "
-        f"brief — set the scene and establish the day's dominant theme. "
-        f"Explain what the regime means, connect the signals, and highlight "
-        f"what matters most for positioning.\n\n{data_block}{extra}"
-    )
-
-
-def pulse_takeaways_prompt(
-    regime: str,
-    big_narrative: str,
-    existing_takeaways: list[str],
-) -> str:
     takeaways_text = "\n".join(f"- {t}" for t in existing_takeaways)
+    parts.append(f"Rule-based takeaways:\n{takeaways_text}")
+    data_block = "\n\n".join(parts)
+    extra = _format_extra(research_context, custom_prompt)
     return (
-        f"Current regime: {regime}\n"
-        f"Narrative context: {big_narrative[:500]}\n"
-        f"Rule-based takeaways:\n{takeaways_text}\n\n"
-        f"Rewrite these takeaways to be sharper and more actionable. "
-        f"Return exactly {len(existing_takeaways)} bullet points, "
-        f"each on its own line starting with '- '. "
-        f"Keep them under 20 words each."
+        f"Given the following market data, write today's market pulse.\n\n"
+        f"narrative: a compelling 2-3 paragraph narrative (the 'big "
+        f"picture'), paragraphs separated by blank lines. Write as if this "
+        f"is the opening section of a professional daily brief — set the "
+        f"scene and establish the day's dominant theme. Explain what the "
+        f"regime means, connect the signals, and highlight what matters most "
+        f"for positioning.\n"
+        f"takeaways: rewrite the rule-based takeaways to be sharper, more "
+        f"actionable and consistent with your narrative. Keep them under 20 "
+        f"words each.\n\n"
+        f"{data_block}{extra}\n\n"
+        f"{_json_instruction('narrative', 'takeaways', len(existing_takeaways))}"
     )
 
 
-def macro_outlook_prompt(
+def macro_combined_prompt(
     us_headline: str | None,
     eu_headline: str | None,
     asia_headline: str | None,
     existing_outlook: str,
+    existing_themes: list[str],
     research_context: list | None = None,
     custom_prompt: str | None = None,
 ) -> str:
+    """Prompt for the global outlook and cross-regional themes in one call."""
     parts = []
     if us_headline:
         parts.append(f"US: {us_headline}")
@@ -143,30 +160,19 @@ def macro_outlook_prompt(
     if asia_headline:
         parts.append(f"Asia: {asia_headline}")
     regions = "\n".join(parts) if parts else "No regional data available"
-    research_block = _format_research_context(research_context or [])
-    extra = f"\n\n{research_block}\n\n{_RESEARCH_INSTRUCTION}" if research_block else ""
-    extra += _format_custom_prompt(custom_prompt)
-    return (
-        f"Regional macro summaries:\n{regions}\n\n"
-        f"Current outlook: {existing_outlook}\n\n"
-        f"Write a concise 2-3 sentence global macro outlook that synthesizes "
-        f"these regional views into a coherent narrative. Focus on the "
-        f"interplay between regions and what it means for global risk.{extra}"
-    )
-
-
-def macro_themes_prompt(
-    existing_themes: list[str],
-    outlook: str,
-) -> str:
     themes_text = "\n".join(f"- {t}" for t in existing_themes)
+    extra = _format_extra(research_context, custom_prompt)
     return (
-        f"Global outlook: {outlook[:300]}\n"
+        f"Regional macro summaries:\n{regions}\n\n"
+        f"Current outlook: {existing_outlook}\n"
         f"Rule-based themes:\n{themes_text}\n\n"
-        f"Refine these cross-regional themes to be more insightful. "
-        f"Return exactly {len(existing_themes)} themes, "
-        f"each on its own line starting with '- '. "
-        f"Make them specific and forward-looking."
+        f"outlook: a concise 2-3 sentence global macro outlook that "
+        f"synthesizes these regional views into a coherent narrative. Focus "
+        f"on the interplay between regions and what it means for global "
+        f"risk.\n"
+        f"themes: refine the cross-regional themes to be more insightful, "
+        f"specific and forward-looking, consistent with your outlook.{extra}\n\n"
+        f"{_json_instruction('outlook', 'themes', len(existing_themes))}"
     )
 
 
@@ -187,9 +193,7 @@ def sentiment_narrative_prompt(
         if contrarian_signals
         else "None detected"
     )
-    research_block = _format_research_context(research_context or [])
-    extra = f"\n\n{research_block}\n\n{_RESEARCH_INSTRUCTION}" if research_block else ""
-    extra += _format_custom_prompt(custom_prompt)
+    extra = _format_extra(research_context, custom_prompt)
     return (
         f"Retail sentiment data ({total_posts} data points analyzed):\n"
         f"- Overall score: {overall_score:+.2f}\n"
@@ -215,9 +219,7 @@ def forward_lesson_prompt(
     custom_prompt: str | None = None,
 ) -> str:
     events_text = "\n".join(f"- {e}" for e in events[:5])
-    research_block = _format_research_context(research_context or [])
-    extra = f"\n\n{research_block}\n\n{_RESEARCH_INSTRUCTION}" if research_block else ""
-    extra += _format_custom_prompt(custom_prompt)
+    extra = _format_extra(research_context, custom_prompt)
     return (
         f"Upcoming events:\n{events_text}\n"
         f"Outlier scenario: {outlier_event}\n"
@@ -0,0 +1,129 @@
+"""Tests for DataSource caching behaviour."""
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from src.ingestion.base import CacheManager, DataSource
+from src.ingestion.tier1_core.fred_client import FREDData, _parse_observations
+
+
+class _NullCache:
+    """Cache stub that always misses."""
+
+    async def get(self, key: str) -> Any | None:
+        return None
+
+    async def set(self, key: str, value: Any, ttl: int = 3600) -> bool:
+        return True
+
+
+class _DictRedis:
+    """In-memory stand-in for the Redis client."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, Any] = {}
+
+    async def get(self, key: str) -> Any | None:
+        return self.data.get(key)
+
+    async def setex(self, key: str, ttl: int, value: Any) -> None:
+        self.data[key] = value
+
+
+class _DummySource(DataSource[dict]):
+    source_name = "dummy"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.cache = _NullCache()
+
+    async def health_check(self) -> bool:
+        return True
+
+    async def fetch_latest(self) -> dict | None:
+        return None
+
+
+class TestWithCache:
+    """Tests for DataSource._with_cache."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_fetch(self):
+        """Concurrent callers for the same key trigger a single fetch."""
+        source = _DummySource()
+        calls = 0
+
+        async def _fetch() -> dict:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"value": calls}
+
+        results = await asyncio.gather(
+            *(source._with_cache("quote", _fetch, "SPX") for _ in range(5))
+        )
+
+        assert calls == 1
+        assert all(r == {"value": 1} for r in results)
+        assert source._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_distinct_keys_fetch_separately(self):
+        """Different cache keys are not collapsed."""
+        source = _DummySource()
+        calls = 0
+
+        async def _fetch() -> dict:
+            nonlocal calls
+            calls += 1
+            return {}
+
+        await asyncio.gather(
+            source._with_cache("quote", _fetch, "SPX"),
+            source._with_cache("quote", _fetch, "VIX"),
+        )
+
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_fetch_error_propagates_to_all_waiters(self):
+        """A failing fetch raises for every concurrent caller."""
+        source = _DummySource()
+
+        async def _fetch() -> dict:
+            await asyncio.sleep(0.01)
+            raise RuntimeError("upstream down")
+
+        results = await asyncio.gather(
+            source._with_cache("quote", _fetch, "SPX"),
+            source._with_cache("quote", _fetch, "SPX"),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+
+class TestCacheManager:
+    """Tests for CacheManager serialization."""
+
+    @pytest.mark.asyncio
+    async def test_fred_data_round_trips(self, monkeypatch):
+        """FREDData records (int column key from reset_index) are cached."""
+        cache = CacheManager()
+        monkeypatch.setattr(cache, "_redis", _DictRedis())
+        series = _parse_observations(
+            [
+                {"date": "2024-01-01", "value": "4.10"},
+                {"date": "2024-01-02", "value": "4.25"},
+            ]
+        )
+        fred = FREDData("DGS10", "10-Year Treasury", series)
+
+        assert await cache.set("fred:DGS10", {"DGS10": fred}) is True
+
+        cached = await cache.get("fred:DGS10")
+        assert cached["DGS10"]["latest_value"] == 4.25
+        assert cached["DGS10"]["previous_value"] == 4.10
+        assert [r["0"] for r in cached["DGS10"]["data"]] == [4.10, 4.25]
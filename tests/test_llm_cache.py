@@ -0,0 +1,67 @@
+"""Tests for the LLM response cache."""
+
+from typing import Any
+
+import pytest
+
+from src.llm.cache import LLMCache
+
+
+class _DictBackend:
+    """In-memory stand-in for the shared (Redis) tier."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, Any] = {}
+
+    async def get(self, key: str) -> Any | None:
+        return self.data.get(key)
+
+    async def set(self, key: str, value: Any, ttl: int = 3600) -> bool:
+        self.data[key] = value
+        return True
+
+
+class TestLLMCache:
+    """Tests for LLMCache."""
+
+    def test_key_covers_every_request_field(self):
+        """Changing any part of the request changes the key."""
+        base = ("openai", "gpt-4o-mini", "system", "prompt")
+        key = LLMCache.cache_key(*base)
+
+        assert key == LLMCache.cache_key(*base)
+        for i in range(len(base)):
+            changed = list(base)
+            changed[i] += "!"
+            assert LLMCache.cache_key(*changed) != key
+
+    @pytest.mark.asyncio
+    async def test_set_then_get(self):
+        """A stored response is served from memory and the shared tier."""
+        shared = _DictBackend()
+        cache = LLMCache(ttl=60, shared=shared)
+
+        await cache.set("k", "answer")
+
+        assert await cache.get("k") == "answer"
+        assert shared.data == {"k": "answer"}
+
+    @pytest.mark.asyncio
+    async def test_shared_hit_warms_memory(self):
+        """A miss in memory falls through to the shared tier."""
+        shared = _DictBackend()
+        shared.data["k"] = "from redis"
+        cache = LLMCache(ttl=60, shared=shared)
+
+        assert await cache.get("k") == "from redis"
+        shared.data.clear()
+        assert await cache.get("k") == "from redis"
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_misses(self):
+        """Entries past their TTL are not returned."""
+        cache = LLMCache(ttl=-1)
+
+        await cache.set("k", "stale")
+
+        assert await cache.get("k") is None
@@ -0,0 +1,60 @@
+"""Tests for LLMClient failure handling."""
+
+import pytest
+
+from src.llm import client as llm_client
+from src.llm.cache import LLMCache
+from src.llm.client import LLMClient, LLMUnavailableError
+
+
+class _FailingProvider(llm_client._BaseLLMClient):
+    """Provider stub that always raises and counts its calls."""
+
+    calls = 0
+
+    def __init__(self, model: str | None = None) -> None:
+        self.model = model
+
+    async def generate(self, *args, **kwargs) -> str:
+        type(self).calls += 1
+        raise RuntimeError("provider down")
+
+
+@pytest.fixture
+def failing_client(monkeypatch):
+    monkeypatch.setitem(llm_client._PROVIDERS, "ollama", _FailingProvider)
+    monkeypatch.setattr(llm_client, "_provider_clients", {})
+    monkeypatch.setattr(llm_client, "_breakers", {})
+    monkeypatch.setattr(llm_client, "_get_response_cache", lambda: LLMCache())
+    _FailingProvider.calls = 0
+    return LLMClient("ollama")
+
+
+class TestCircuitBreaker:
+    """Tests for the per-provider circuit breaker."""
+
+    @pytest.mark.asyncio
+    async def test_opens_after_threshold(self, failing_client):
+        """Once open, calls fail fast without reaching the provider."""
+        for i in range(llm_client._BREAKER_THRESHOLD):
+            with pytest.raises(RuntimeError, match="provider down"):
+                await failing_client.generate(f"prompt {i}")
+
+        with pytest.raises(LLMUnavailableError):
+            await failing_client.generate("one more")
+        assert _FailingProvider.calls == llm_client._BREAKER_THRESHOLD
+
+    @pytest.mark.asyncio
+    async def test_single_failure_after_cooldown_reopens(
+        self, failing_client, monkeypatch
+    ):
+        """After the cooldown, a single failure opens the circuit again."""
+        for i in range(llm_client._BREAKER_THRESHOLD):
+            with pytest.raises(RuntimeError):
+                await failing_client.generate(f"prompt {i}")
+
+        llm_client._breakers["ollama"].open_until = 0.0
+        with pytest.raises(RuntimeError, match="provider down"):
+            await failing_client.generate("after cooldown")
+        with pytest.raises(LLMUnavailableError):
+            await failing_client.generate("again")
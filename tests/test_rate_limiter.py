@@ -41,6 +41,20 @@ class TestRateLimiter:
         wait_time = await limiter.acquire()
         assert wait_time > 0
 
+    @pytest.mark.asyncio
+    async def test_waiting_caller_does_not_block_others(self):
+        """A caller sleeping for a large deficit doesn't hold the lock."""
+        limiter = RateLimiter(rate=1.0, capacity=10.0)
+        limiter.tokens = 1
+
+        big = asyncio.create_task(limiter.acquire(5))
+        await asyncio.sleep(0)
+
+        wait_time = await asyncio.wait_for(limiter.acquire(1), timeout=0.5)
+        assert wait_time == 0.0
+
+        big.cancel()
+
     def test_available_tokens(self):
         """Test available tokens property."""
         limiter = RateLimiter.from_per_minute(60)
@@ -49,6 +63,16 @@ class TestRateLimiter:
 
         assert limiter.available_tokens < 60
 
+    def test_failed_try_acquire_leaves_state_untouched(self):
+        """Rejected try_acquire and available_tokens reads don't write state."""
+        limiter = RateLimiter(rate=1.0, capacity=1.0)
+        limiter.try_acquire()
+        tokens, last_update = limiter.tokens, limiter.last_update
+
+        assert limiter.try_acquire() is False
+        assert limiter.available_tokens < 1.0
+        assert (limiter.tokens, limiter.last_update) == (tokens, last_update)
+
 
 class TestRateLimiterRegistry:
     """Tests for RateLimiterRegistry."""